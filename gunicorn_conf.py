@@ -0,0 +1,23 @@
+"""
+Gunicorn configuration for the PolicyGraph QA API
+
+Run with:
+    gunicorn -c gunicorn_conf.py src.api.main:app
+
+preload_app imports the application (FastAPI app, langchain/openai/neo4j
+modules) once in the master before forking, so workers share that memory
+via copy-on-write. Engine construction stays in the FastAPI startup event
+on purpose: PolicyQAEngine owns Bolt and HTTP sockets, which must be
+opened per worker after the fork, not inherited from the master.
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+worker_connections = 1000
+timeout = 120
+keepalive = 5
+accesslog = "-"
@@ -39,28 +39,22 @@ def update_progress(progress_file: str, stage: str, percent: int, detail: str =
             pass
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Ingest PDF with hierarchical structure (조-항-호)")
-    parser.add_argument("--pdf", type=str, required=True, help="Path to PDF file")
-    parser.add_argument("--product-code", type=str, required=True, help="Product code")
-    parser.add_argument("--product-name", type=str, required=True, help="Product name")
-    parser.add_argument("--version-id", type=str, required=True, help="Version ID")
-    parser.add_argument("--max-clauses", type=int, default=None, help="Max clauses to process")
-    parser.add_argument("--progress-file", type=str, default=None, help="Progress file path for status updates")
-    
-    args = parser.parse_args()
-    progress_file = args.progress_file
-    
-    pdf_file = Path(args.pdf)
-    product_code = args.product_code
-    product_name = args.product_name
-    version_id = args.version_id
-    max_clauses = args.max_clauses
-    
+def ingest(pdf: str, product_code: str, product_name: str, version_id: str,
+           max_clauses: int = None, progress_file: str = None) -> dict:
+    """
+    Run the full hierarchical ingestion for one PDF.
+
+    Importable entrypoint so callers (e.g. the API) can run ingestion
+    in-process instead of paying interpreter startup + library imports
+    per job via a subprocess.
+
+    Returns the ingestion stats dict; raises on failure.
+    """
+    pdf_file = Path(pdf)
+
     if not pdf_file.exists():
-        logger.error(f"PDF 파일을 찾을 수 없습니다: {pdf_file}")
-        return
-    
+        raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_file}")
+
     logger.info("="*80)
     logger.info("📦 계층적 PDF Ingestion 시작 (조-항-호)")
     logger.info("="*80)
@@ -432,9 +426,30 @@ def main():
         logger.error(f"❌ Ingestion 실패: {e}")
         import traceback
         traceback.print_exc()
+        raise
     finally:
         driver.close()
 
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest PDF with hierarchical structure (조-항-호)")
+    parser.add_argument("--pdf", type=str, required=True, help="Path to PDF file")
+    parser.add_argument("--product-code", type=str, required=True, help="Product code")
+    parser.add_argument("--product-name", type=str, required=True, help="Product name")
+    parser.add_argument("--version-id", type=str, required=True, help="Version ID")
+    parser.add_argument("--max-clauses", type=int, default=None, help="Max clauses to process")
+    parser.add_argument("--progress-file", type=str, default=None, help="Progress file path for status updates")
+
+    args = parser.parse_args()
+
+    try:
+        ingest(args.pdf, args.product_code, args.product_name, args.version_id,
+               max_clauses=args.max_clauses, progress_file=args.progress_file)
+    except Exception:
+        sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,83 @@
+"""
+Shared sample policy text for the test scripts
+
+Both test_ingestion.py and test_parsing.py used to carry near-identical
+copies of this text and re-ran the same regex scan over it. The parsed
+clauses are cached to disk keyed on the text hash, so a second script
+run (or a CI run invoking both) reloads them instantly.
+"""
+import hashlib
+import pickle
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from src.parsers.clause_extractor import Clause, ClauseExtractor
+
+# Sample insurance policy text
+SAMPLE_POLICY_TEXT = """
+【도난위험 특별약관】
+
+제1조(보상하는 손해) 회사는 보험증권에 기재된 보험의 목적에 대하여 도난으로 인한 손해를 보상합니다.
+① 도난으로 인한 직접적인 손해를 보상합니다.
+② 도난물품의 회수에 소요된 비용을 보상합니다.
+
+제2조(보상하지 아니하는 손해) 회사는 다음의 손해는 보상하지 아니합니다.
+1. 계약자, 피보험자 또는 이들의 법정대리인의 고의 또는 중대한 과실로 생긴 손해
+2. 전쟁, 혁명, 내란, 사변, 폭동, 소요 및 이와 유사한 사태로 생긴 손해
+3. 지진, 분화 등 천재지변으로 생긴 손해
+
+제3조(자기부담금) 회사가 보상할 손해액에서 증권에 기재된 자기부담금을 공제하고 보험금을 지급합니다.
+
+제11조(보상하는 손해) 회사는 이 계약에 따라 보험의 목적에 대하여 다음 각호의 손해를 보상합니다.
+1. 직접손해: 화재, 낙뢰, 파열 또는 폭발로 보험의 목적에 생긴 손해를 말합니다.
+2. 소방손해: 화재를 소방하기 위하여 필요한 조치로 생긴 손해를 말합니다.
+3. 피난손해: 화재가 발생한 때 피난으로 생긴 보험의 목적의 손해를 말합니다.
+4. 잔존물 제거비용: 손해를 입은 보험의 목적의 잔존물을 제거하는데 드는 비용
+5. 손해방지비용: 손해의 방지 또는 경감을 위하여 지출한 필요 또는 유익한 비용
+
+다만, 계약자, 피보험자 또는 이들의 법정대리인의 고의 또는 중대한 과실로 생긴 손해는 보상하지 아니합니다.
+"""
+
+# Bump when ClauseExtractor parsing logic changes to invalidate cached results
+EXTRACTOR_VERSION = 1
+
+CACHE_DIR = Path(".cache/parser")
+
+
+def get_sample_clauses(text: str = SAMPLE_POLICY_TEXT) -> list:
+    """
+    Extract clauses (with items) from the sample text, memoized on disk
+
+    Args:
+        text: Policy text to parse (defaults to the shared sample)
+
+    Returns:
+        List of Clause objects
+    """
+    key = hashlib.sha256(f"v{EXTRACTOR_VERSION}:{text}".encode("utf-8")).hexdigest()
+    cache_file = CACHE_DIR / f"{key}.pkl"
+
+    if cache_file.exists():
+        try:
+            clauses = pickle.loads(cache_file.read_bytes())
+            logger.debug(f"Loaded {len(clauses)} cached clauses from {cache_file}")
+            return clauses
+        except Exception as e:
+            logger.debug(f"Parser cache read failed ({e}), re-parsing")
+
+    extractor = ClauseExtractor()
+    clauses = extractor.extract_clauses(text)
+    for clause in clauses:
+        extractor.extract_items_from_clause(clause)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_bytes(pickle.dumps(clauses))
+    except Exception as e:
+        logger.debug(f"Parser cache write failed: {e}")
+
+    return clauses
@@ -7,8 +7,12 @@ Tests the new retrieval logic:
 2. Get parent Articles
 3. LLM selects best Article
 4. Build context with REFERS_TO connections
+
+The test queries are independent, so retrieval + answer generation runs
+in a thread pool (I/O-bound: embedding, Neo4j, LLM calls all release the GIL).
 """
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
@@ -43,15 +47,41 @@ def main():
     ]
     
     openai_client = OpenAI(api_key=settings.openai_api_key)
-    
-    for i, query in enumerate(test_queries, 1):
+
+    def run_pipeline(query: str):
+        """Retrieve context and generate an answer for one query"""
+        result = retriever.retrieve(query, top_k=5)
+
+        answer = None
+        answer_error = None
+        if result['selected_article']:
+            try:
+                response = openai_client.chat.completions.create(
+                    model=settings.llm_model,
+                    messages=[
+                        {"role": "system", "content": "당신은 보험약관 전문가입니다. 주어진 약관 내용을 바탕으로 사용자 질문에 정확하고 친절하게 답변해주세요."},
+                        {"role": "user", "content": f"약관 내용:\n\n{result['context']}\n\n질문: {query}\n\n답변:"}
+                    ],
+                    temperature=0.3,
+                    max_tokens=500
+                )
+                answer = response.choices[0].message.content
+            except Exception as e:
+                answer_error = e
+
+        return result, answer, answer_error
+
+    # Queries are independent: run all pipelines concurrently.
+    # The Neo4j driver is thread-safe and each thread gets its own pooled connection,
+    # so wall time ≈ slowest query instead of the sum.
+    with ThreadPoolExecutor(max_workers=len(test_queries)) as executor:
+        outputs = list(executor.map(run_pipeline, test_queries))
+
+    for i, (query, (result, answer, answer_error)) in enumerate(zip(test_queries, outputs), 1):
         logger.info(f"\n{'='*80}")
         logger.info(f"[Test {i}/{len(test_queries)}] Query: {query}")
         logger.info(f"{'='*80}\n")
-        
-        # Retrieve context
-        result = retriever.retrieve(query, top_k=5)
-        
+
         if result['selected_article']:
             print("✅ 선택된 조항:")
             print(f"   {result['selected_article']['articleId']}: {result['selected_article']['title']}")
@@ -76,24 +106,12 @@ def main():
             print("...")
             print()
             
-            # Generate answer using LLM
+            # Answer was generated concurrently in the pipeline above
             print("💬 생성된 답변:")
-            try:
-                response = openai_client.chat.completions.create(
-                    model=settings.llm_model,
-                    messages=[
-                        {"role": "system", "content": "당신은 보험약관 전문가입니다. 주어진 약관 내용을 바탕으로 사용자 질문에 정확하고 친절하게 답변해주세요."},
-                        {"role": "user", "content": f"약관 내용:\n\n{result['context']}\n\n질문: {query}\n\n답변:"}
-                    ],
-                    temperature=0.3,
-                    max_tokens=500
-                )
-                
-                answer = response.choices[0].message.content
+            if answer is not None:
                 print(answer)
-                
-            except Exception as e:
-                logger.error(f"Answer generation failed: {e}")
+            else:
+                logger.error(f"Answer generation failed: {answer_error}")
         else:
             print("❌ 관련 조항을 찾을 수 없습니다.")
             if 'error' in result.get('metadata', {}):
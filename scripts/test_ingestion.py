@@ -2,6 +2,7 @@
 """
 Test ingestion with sample text (no PDF needed)
 """
+import asyncio
 import sys
 from pathlib import Path
 
@@ -13,58 +14,47 @@ from neo4j import GraphDatabase
 from openai import OpenAI
 
 from src.config.settings import settings
-from src.parsers.clause_extractor import ClauseExtractor
 from src.chunking.semantic_chunker import SemanticChunker
-
-# Sample policy text
-SAMPLE_POLICY_TEXT = """
-【도난위험 특별약관】
-
-제1조(보상하는 손해) 회사는 보험증권에 기재된 보험의 목적에 대하여 도난으로 인한 손해를 보상합니다.
-① 도난으로 인한 직접적인 손해를 보상합니다.
-② 도난물품의 회수에 소요된 비용을 보상합니다.
-
-제2조(보상하지 아니하는 손해) 회사는 다음의 손해는 보상하지 아니합니다.
-1. 계약자, 피보험자 또는 이들의 법정대리인의 고의 또는 중대한 과실로 생긴 손해
-2. 전쟁, 혁명, 내란, 사변, 폭동, 소요 및 이와 유사한 사태로 생긴 손해
-3. 지진, 분화 등 천재지변으로 생긴 손해
-
-제3조(자기부담금) 회사가 보상할 손해액에서 증권에 기재된 자기부담금을 공제하고 보험금을 지급합니다.
-"""
+from sample_policy import get_sample_clauses
 
 def main():
     print("\n" + "="*80)
     print("🚀 테스트 데이터 Ingestion 시작")
     print("="*80)
-    
-    # Step 1: Extract clauses
+
+    # Step 1: Extract clauses (shared sample, parse result cached on disk)
     print("\n[Step 1] 조항 추출...")
-    extractor = ClauseExtractor()
-    clauses = extractor.extract_clauses(SAMPLE_POLICY_TEXT)
-    
-    for clause in clauses:
-        extractor.extract_items_from_clause(clause)
-    
+    clauses = get_sample_clauses()
+
     print(f"✅ {len(clauses)}개 조항 추출 완료")
     
     # Step 2: Semantic chunking
     print("\n[Step 2] 시맨틱 청킹...")
     chunker = SemanticChunker()
-    all_chunks = []
-    
+
+    # Pre-filter: only long clauses need LLM chunking, short ones are skipped.
+    # Metadata dicts are built once here instead of per chunk_text call.
+    long_clauses = [
+        (c, {'clause_id': c.clause_id, 'title': c.title, 'clause_type': c.clause_type})
+        for c in clauses if len(c.full_text) > 150
+    ]
+    long_ids = {c.clause_id for c, _ in long_clauses}
     for clause in clauses:
-        if len(clause.full_text) > 150:
-            metadata = {
-                'clause_id': clause.clause_id,
-                'title': clause.title,
-                'clause_type': clause.clause_type
-            }
-            chunks = chunker.chunk_text(clause.full_text, metadata)
-            all_chunks.extend(chunks)
-            print(f"  {clause.clause_id}: {len(chunks)}개 청크")
-        else:
+        if clause.clause_id not in long_ids:
             print(f"  {clause.clause_id}: 텍스트가 짧아 건너뜀")
-    
+
+    # Each chunk_text call is LLM-bound; fire them concurrently
+    async def chunk_all():
+        return await asyncio.gather(*[
+            chunker.chunk_text_async(clause.full_text, metadata)
+            for clause, metadata in long_clauses
+        ])
+
+    all_chunks = []
+    for (clause, _), chunks in zip(long_clauses, asyncio.run(chunk_all())):
+        all_chunks.extend(chunks)
+        print(f"  {clause.clause_id}: {len(chunks)}개 청크")
+
     print(f"✅ 총 {len(all_chunks)}개 청크 생성")
     
     # Step 3: Generate embeddings
@@ -1,24 +1,59 @@
 """
 FastAPI application for PolicyGraph QA system
 """
-from fastapi import FastAPI, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, UploadFile, File, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
 from loguru import logger
+import hashlib
+import json
 import os
+import re
+import time
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import asyncio
 
+import aiofiles
+from cachetools import TTLCache
+import faiss
+import numpy as np
+from neo4j import AsyncGraphDatabase, GraphDatabase
+import httpx
+from openai import AsyncOpenAI, OpenAI
+
+try:
+    from asyncinotify import Inotify, Mask
+except ImportError:  # inotify is Linux-only; progress watching falls back to polling
+    Inotify = None
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # Redis is only needed for multi-worker job tracking
+    redis = None
+
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+except ImportError:  # arq is only needed for durable ingestion queues
+    create_pool = None
+
 from src.rag.qa_engine import PolicyQAEngine
+from src.retrieval.hierarchical_retriever import HierarchicalRetriever
 from src.config.settings import settings
+from scripts.ingest_hierarchical import ingest
 
 # Initialize FastAPI app
 app = FastAPI(
     title="PolicyGraph QA API",
     description="Insurance Policy GraphRAG QA System",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the large citation/graph payloads in C instead of
+    # pure-Python json.dumps
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -33,14 +68,419 @@ app.add_middleware(
 # Initialize QA engine
 qa_engine = None
 
-# Ingestion job tracking
-ingestion_jobs: Dict[str, Dict[str, Any]] = {}
+# Shared Neo4j driver - creating a driver per request pays TLS + pool setup
+# every time, so one driver (with its Bolt connection pool) serves all handlers
+neo4j_driver = None
+
+
+def get_neo4j_driver():
+    """Get the shared Neo4j driver, creating it on first use"""
+    global neo4j_driver
+    if neo4j_driver is None:
+        neo4j_driver = GraphDatabase.driver(
+            settings.neo4j_uri,
+            auth=(settings.neo4j_username, settings.neo4j_password),
+            max_connection_pool_size=50
+        )
+    return neo4j_driver
+
+
+# Shared retriever - it is stateless per query, and constructing one per
+# request would rebuild its OpenAI client every time
+hierarchical_retriever = None
+
+
+def get_hierarchical_retriever() -> HierarchicalRetriever:
+    """Get the shared HierarchicalRetriever, creating it on first use"""
+    global hierarchical_retriever
+    if hierarchical_retriever is None:
+        hierarchical_retriever = HierarchicalRetriever(get_neo4j_driver())
+    return hierarchical_retriever
+
+
+# Async Neo4j driver for handlers that issue Cypher directly — Bolt
+# round-trips are awaited instead of blocking the event loop. The sync
+# driver above stays for the retrieval stack, which runs in the threadpool.
+async_neo4j_driver = None
+
+
+def get_async_neo4j_driver():
+    """Get the shared async Neo4j driver, creating it on first use"""
+    global async_neo4j_driver
+    if async_neo4j_driver is None:
+        async_neo4j_driver = AsyncGraphDatabase.driver(
+            settings.neo4j_uri,
+            auth=(settings.neo4j_username, settings.neo4j_password),
+            max_connection_pool_size=50
+        )
+    return async_neo4j_driver
+
+
+# Shared OpenAI client - reusing one client keeps the underlying httpx
+# connection pool (HTTP keep-alive to api.openai.com) warm across requests
+openai_client = None
+
+
+def get_openai_client() -> OpenAI:
+    """Get the shared OpenAI client, creating it on first use"""
+    global openai_client
+    if openai_client is None:
+        openai_client = OpenAI(api_key=settings.openai_api_key)
+    return openai_client
+
+
+# Async OpenAI client for calls awaited directly on the event loop —
+# HTTP/2 multiplexes concurrent requests over one keep-alive connection,
+# so the TLS handshake is paid once instead of per call
+async_openai_client = None
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Get the shared async OpenAI client, creating it on first use"""
+    global async_openai_client
+    if async_openai_client is None:
+        async_openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+            )
+        )
+    return async_openai_client
+
+class IngestionJobStore:
+    """Tracks ingestion jobs so any worker can answer status queries.
+
+    Uses Redis when settings.redis_url is set — required for multi-worker
+    deploys, where a status poll may land on a different worker than the
+    one running the job. Falls back to an in-process TTL cache otherwise,
+    bounded so finished jobs age out instead of leaking one entry per
+    upload for the life of the worker.
+    """
+
+    TTL = 86400
+
+    def __init__(self):
+        self._local: TTLCache = TTLCache(maxsize=1024, ttl=self.TTL)
+        self._redis = None
+        if redis is not None and settings.redis_url:
+            self._redis = redis.from_url(settings.redis_url, decode_responses=True)
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        return f"ingestion_job:{job_id}"
+
+    async def set(self, job_id: str, job: Dict[str, Any]):
+        if self._redis is not None:
+            payload = json.dumps(job)
+            await self._redis.set(self._key(job_id), payload, ex=self.TTL)
+            # Progress events fan out over pub/sub so stream/SSE consumers
+            # on any worker can follow a job without polling
+            await self._redis.publish(self._key(job_id), payload)
+        else:
+            self._local[job_id] = job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        if self._redis is not None:
+            raw = await self._redis.get(self._key(job_id))
+            return json.loads(raw) if raw else None
+        return self._local.get(job_id)
+
+    async def update(self, job_id: str, **fields):
+        job = await self.get(job_id) or {}
+        job.update(fields)
+        await self.set(job_id, job)
+
+    async def close(self):
+        if self._redis is not None:
+            await self._redis.aclose()
+
+
+ingestion_jobs = IngestionJobStore()
+
+# Warm worker processes for ingestion jobs — created lazily so plain API
+# workers that never ingest don't fork a pool
+ingest_pool = None
+
+
+def get_ingest_pool() -> ProcessPoolExecutor:
+    """Get the shared ingestion process pool, creating it on first use"""
+    global ingest_pool
+    if ingest_pool is None:
+        ingest_pool = ProcessPoolExecutor(max_workers=2)
+    return ingest_pool
+
+
+# Matches the pool size: at most two ingestions run at once, and jobs
+# waiting for a slot are reported as "queued" rather than silently pending
+INGEST_SEM = asyncio.Semaphore(2)
+
+# arq connection pool for durable ingestion jobs (only when Redis + arq
+# are available); in-process BackgroundTasks remain the fallback
+arq_pool = None
+
+
+async def get_arq_pool():
+    """Get the shared arq Redis pool, creating it on first use"""
+    global arq_pool
+    if arq_pool is None:
+        arq_pool = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+    return arq_pool
+
+# Cap threadpool usage for offloaded blocking calls (LLM/Neo4j) so a burst
+# of requests doesn't spawn an unbounded number of worker threads
+MAX_CONCURRENT_THREADS = 32
+_blocking_limiter = asyncio.Semaphore(MAX_CONCURRENT_THREADS)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the threadpool without stalling the event loop"""
+    async with _blocking_limiter:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+class SemanticQueryCache:
+    """
+    In-process semantic cache for query results
+
+    Questions are matched by embedding similarity (FAISS inner product on
+    L2-normalized vectors), so paraphrased repeats of recent questions are
+    served from memory instead of re-running retrieval + LLM synthesis.
+    Entries expire after a TTL and the oldest half is evicted when full.
+    """
+
+    def __init__(self, dimensions: int, threshold: float = 0.92,
+                 ttl: float = 300.0, max_entries: int = 256):
+        self.index = faiss.IndexFlatIP(dimensions)
+        self.entries: List[Dict[str, Any]] = []  # aligned with index rows
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = asyncio.Lock()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vec = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    async def get(self, embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return a cached result if a similar, unexpired question exists"""
+        vec = self._normalize(embedding)
+        async with self.lock:
+            if self.index.ntotal == 0:
+                return None
+            scores, ids = self.index.search(vec, 1)
+            score, idx = float(scores[0][0]), int(ids[0][0])
+            if idx < 0 or score < self.threshold:
+                return None
+            entry = self.entries[idx]
+            if time.monotonic() - entry['ts'] > self.ttl:
+                return None
+            return entry['result']
+
+    async def put(self, embedding: List[float], result: Dict[str, Any]):
+        """Store a result, de-duping near-identical questions"""
+        vec = self._normalize(embedding)
+        async with self.lock:
+            if self.index.ntotal:
+                scores, ids = self.index.search(vec, 1)
+                if float(scores[0][0]) > 0.95:
+                    # Refresh the existing near-duplicate entry instead
+                    idx = int(ids[0][0])
+                    self.entries[idx]['result'] = result
+                    self.entries[idx]['ts'] = time.monotonic()
+                    return
+
+            if len(self.entries) >= self.max_entries:
+                # Evict the oldest half and rebuild the flat index
+                keep = sorted(
+                    range(len(self.entries)),
+                    key=lambda i: self.entries[i]['ts'],
+                    reverse=True
+                )[:self.max_entries // 2]
+                self.entries = [self.entries[i] for i in keep]
+                self.index.reset()
+                if self.entries:
+                    self.index.add(np.vstack([e['vec'] for e in self.entries]))
+
+            self.entries.append({'vec': vec, 'result': result, 'ts': time.monotonic()})
+            self.index.add(vec)
+
+
+query_cache = SemanticQueryCache(dimensions=settings.vector_dimensions)
+
+# Exact-match result cache in front of the semantic cache — a verbatim
+# repeat of a recent question skips even the embedding call
+response_cache: TTLCache = TTLCache(maxsize=2048, ttl=600)
+
+
+def _question_cache_key(question: str) -> bytes:
+    """Hash of the normalized question for exact-match lookups"""
+    return hashlib.blake2b(question.strip().lower().encode(), digest_size=16).digest()
+
+
+class QueryBatcher:
+    """
+    Coalesces concurrent /query calls into one dispatch
+
+    Questions arriving within a short window are collected and answered
+    together: in-flight duplicates share a single pipeline run instead of
+    each missing the cache and re-running retrieval + LLM. The added
+    latency is bounded by the queue window.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_queue_time: float = 0.03):
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: List[Any] = []  # (question, future) pairs
+        self._flush_task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def process(self, question: str) -> Dict[str, Any]:
+        """Queue a question and wait for its result"""
+        future = asyncio.get_running_loop().create_future()
+        async with self._lock:
+            self._pending.append((question, future))
+            if len(self._pending) >= self.max_batch_size:
+                batch, self._pending = self._pending, []
+                asyncio.create_task(self._dispatch(batch))
+            elif self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.max_queue_time)
+        async with self._lock:
+            batch, self._pending = self._pending, []
+            # Drop the flush-task handle before dispatching: dispatch can
+            # take seconds, and questions arriving meanwhile must be able
+            # to schedule their own flush instead of waiting on this one
+            self._flush_task = None
+        if batch:
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch):
+        # Duplicates in the batch run the pipeline once and share the result
+        questions = list(dict.fromkeys(question for question, _ in batch))
+        results = await asyncio.gather(
+            *[run_blocking(qa_engine.query, question) for question in questions],
+            return_exceptions=True
+        )
+        by_question = dict(zip(questions, results))
+        for question, future in batch:
+            if future.done():
+                continue
+            result = by_question[question]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+query_batcher = QueryBatcher()
+
+# Cached /recommended-queries payload - it only changes when the graph does,
+# so it is invalidated on re-ingestion / clear and by a safety-net TTL
+_recommended_queries_cache: Optional[Dict[str, Any]] = None
+_recommended_queries_cached_at: float = 0.0
+RECOMMENDED_QUERIES_TTL = 3600.0
+
+
+def invalidate_recommended_queries_cache():
+    """Drop the cached recommendations after the graph changes"""
+    global _recommended_queries_cache
+    _recommended_queries_cache = None
 
 # Upload directory
 UPLOAD_DIR = Path("data/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Static Cypher for the graph endpoints. Neo4j caches query plans keyed by
+# the literal string, so stable module-level constants guarantee plan-cache
+# hits; execute_read additionally routes these to followers in a cluster.
+CYPHER_NODE_COUNTS = """
+    MATCH (n)
+    WITH labels(n) AS labels, count(*) AS count
+    RETURN labels[0] AS label, count
+    ORDER BY count DESC
+"""
+
+CYPHER_ARTICLE_TEXTS_BY_ID = """
+    UNWIND $ids AS id
+    MATCH (a:Article {articleId: id})
+    RETURN a.articleId AS id, a.text AS text
+"""
+
+CYPHER_REFERS_TO_SAMPLE = """
+    MATCH (a:Article)-[:HAS_PARAGRAPH]->(p:Paragraph)-[r:REFERS_TO]->(ref)
+    RETURN DISTINCT a.articleId as article_id,
+           a.title as article_title,
+           labels(ref)[0] as ref_type,
+           CASE
+             WHEN ref.articleId IS NOT NULL THEN ref.articleId
+             WHEN ref.paragraphId IS NOT NULL THEN ref.paragraphId
+             ELSE ref.itemId
+           END as ref_id
+    LIMIT $limit
+"""
+
+CYPHER_CLEAR_GRAPH = "MATCH (n) DETACH DELETE n"
+
+# Recommended-query prompt with the stable parts first. Keeping the system
+# message and the instruction/format prefix byte-identical across calls lets
+# prefix-caching LLM backends skip re-prefilling everything before the
+# variable reference list, which therefore comes last.
+RECOMMEND_SYSTEM = "당신은 보험약관 전문가입니다."
+RECOMMEND_INSTRUCTION = """보험약관에서 서로 참조하는 조항들이 아래에 주어집니다.
+참조 관계를 활용하여, 답변하기 위해 여러 조항을 함께 읽어야 하는 질문 3개를 생성해주세요.
+
+응답 형식 (JSON):
+{
+  "queries": [
+    {
+      "question": "질문 내용",
+      "description": "이 질문이 왜 여러 조항을 필요로 하는지 간단한 설명",
+      "expected_clauses": ["제X조", "제Y조"]
+    }
+  ]
+}
+
+조항 참조 관계:
+"""
+
+# Lookup constraints the query paths rely on (same definitions as
+# PolicyGraphSchema) — ensured idempotently at startup so cached plans hit
+# index seeks even if init_schema.py was never run against this database
+SCHEMA_LOOKUP_CONSTRAINTS = (
+    """
+    CREATE CONSTRAINT article_id_unique IF NOT EXISTS
+    FOR (a:Article)
+    REQUIRE a.articleId IS UNIQUE
+    """,
+    """
+    CREATE CONSTRAINT paragraph_id_unique IF NOT EXISTS
+    FOR (p:Paragraph)
+    REQUIRE p.paragraphId IS UNIQUE
+    """,
+    """
+    CREATE CONSTRAINT item_id_unique IF NOT EXISTS
+    FOR (i:Item)
+    REQUIRE i.itemId IS UNIQUE
+    """,
+)
+
+
+async def _read_records(session, cypher: str, **params) -> List[Any]:
+    """Run a read-only query through execute_read and collect the records"""
+    async def work(tx):
+        result = await tx.run(cypher, **params)
+        return [record async for record in result]
+
+    return await session.execute_read(work)
+
+
 # Request/Response models
 class QueryRequest(BaseModel):
     question: str
@@ -146,6 +586,21 @@ async def startup_event():
         logger.warning("⚠️ OpenAI API key not configured. Please set it via /api/v1/config/api-key")
         return
     
+    try:
+        get_neo4j_driver()
+        get_hierarchical_retriever()
+        logger.info("✅ Neo4j driver initialized")
+    except Exception as e:
+        logger.error(f"Failed to initialize Neo4j driver: {e}")
+
+    try:
+        async with get_async_neo4j_driver().session() as session:
+            for statement in SCHEMA_LOOKUP_CONSTRAINTS:
+                await session.run(statement)
+        logger.info("✅ Lookup constraints ensured")
+    except Exception as e:
+        logger.warning(f"Could not ensure lookup constraints: {e}")
+
     try:
         qa_engine = PolicyQAEngine()
         logger.info("✅ QA Engine initialized")
@@ -157,10 +612,27 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up resources on shutdown"""
-    global qa_engine
+    global qa_engine, neo4j_driver, async_neo4j_driver
     if qa_engine:
         qa_engine.close()
         logger.info("QA Engine closed")
+    if neo4j_driver:
+        neo4j_driver.close()
+        neo4j_driver = None
+        logger.info("Neo4j driver closed")
+    if async_neo4j_driver:
+        await async_neo4j_driver.close()
+        async_neo4j_driver = None
+        logger.info("Async Neo4j driver closed")
+    global async_openai_client
+    if async_openai_client is not None:
+        await async_openai_client.close()
+        async_openai_client = None
+    await ingestion_jobs.close()
+    if arq_pool is not None:
+        await arq_pool.aclose()
+    if ingest_pool is not None:
+        ingest_pool.shutdown(wait=False)
 
 
 @app.get("/", response_model=HealthResponse)
@@ -205,21 +677,28 @@ async def set_api_key(request: ApiKeyRequest):
     """Set OpenAI API key"""
     global qa_engine
     
+    global openai_client, async_openai_client, hierarchical_retriever
+
     api_key = request.api_key.strip()
-    
+
     if not api_key.startswith("sk-"):
         raise HTTPException(status_code=400, detail="Invalid API key format")
-    
+
     try:
         # Test the API key
-        from openai import OpenAI
         client = OpenAI(api_key=api_key)
-        
+
         # Simple test call
         client.models.list()
-        
+
         # If successful, update settings
         settings.set_openai_api_key(api_key)
+        # Drop the shared clients so the next call picks up the new key
+        openai_client = None
+        hierarchical_retriever = None
+        if async_openai_client is not None:
+            await async_openai_client.close()
+            async_openai_client = None
         
         # Initialize QA engine if not already done
         if not qa_engine:
@@ -250,7 +729,10 @@ async def api_health():
     }
 
 
-@app.post("/api/v1/query", response_model=QueryResponse)
+# No response_model on the hot query endpoints: the engine already produces
+# the response shape, so re-validating it through Pydantic per request is
+# pure overhead. Requests stay validated — user input is untrusted.
+@app.post("/api/v1/query")
 async def query(request: QueryRequest):
     """
     Answer a policy question
@@ -262,16 +744,36 @@ async def query(request: QueryRequest):
         raise HTTPException(status_code=503, detail="QA engine not initialized")
     
     try:
-        result = qa_engine.query(request.question)
-        
-        return QueryResponse(
-            question=result["question"],
-            answer=result["answer"],
-            intent=result["intent"],
-            confidence=result["confidence"],
-            citations=result["citations"],
-            retrieved_chunks_count=result["retrieved_chunks_count"]
+        # Exact repeats are served straight from memory, before embedding
+        cache_key = _question_cache_key(request.question)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            return ORJSONResponse(cached, headers={"X-Cache": "HIT"})
+
+        # Semantic cache: paraphrased repeats skip retrieval + LLM entirely
+        embed_response = await get_async_openai_client().embeddings.create(
+            model=settings.embedding_model,
+            input=request.question
         )
+        question_embedding = embed_response.data[0].embedding
+
+        result = await query_cache.get(question_embedding)
+        if result is None:
+            # Cache miss - coalesce with other in-flight questions so
+            # concurrent duplicates share one pipeline run
+            result = await query_batcher.process(request.question)
+            await query_cache.put(question_embedding, result)
+
+        payload = {
+            "question": result["question"],
+            "answer": result["answer"],
+            "intent": result["intent"],
+            "confidence": result["confidence"],
+            "citations": result["citations"],
+            "retrieved_chunks_count": result["retrieved_chunks_count"]
+        }
+        response_cache[cache_key] = payload
+        return ORJSONResponse(payload, headers={"X-Cache": "MISS"})
     
     except Exception as e:
         logger.error(f"Error processing query: {e}")
@@ -290,8 +792,16 @@ async def batch_query(request: BatchQueryRequest):
         raise HTTPException(status_code=503, detail="QA engine not initialized")
     
     try:
-        results = qa_engine.batch_query(request.questions)
-        return {"results": results}
+        # Answer each distinct question once, then scatter back so the
+        # response still lines up with the submitted order. The per-question
+        # pipelines are I/O-bound (OpenAI + Neo4j), so run them concurrently
+        # instead of back to back.
+        unique_questions = list(dict.fromkeys(request.questions))
+        unique_results = await asyncio.gather(*[
+            run_blocking(qa_engine.query, question) for question in unique_questions
+        ])
+        results_by_question = dict(zip(unique_questions, unique_results))
+        return ORJSONResponse({"results": [results_by_question[q] for q in request.questions]})
     
     except Exception as e:
         logger.error(f"Error processing batch query: {e}")
@@ -299,111 +809,141 @@ async def batch_query(request: BatchQueryRequest):
 
 
 @app.post("/api/v1/query/detailed", response_model=DetailedQueryResponse)
-async def query_detailed(request: DetailedQueryRequest):
+async def query_detailed(request: DetailedQueryRequest, http_request: Request):
     """
     Answer a policy question with detailed process information
-    
+
     - **question**: The policy question to answer
     - **include_process**: Include retrieval and reasoning process
+
+    Clients sending `Accept: text/event-stream` get the answer streamed
+    token-by-token over SSE, followed by a final metadata event; everyone
+    else receives the usual JSON response.
     """
     if not qa_engine:
         raise HTTPException(status_code=503, detail="QA engine not initialized")
-    
+
+    wants_stream = "text/event-stream" in http_request.headers.get("accept", "")
+
     try:
-        from neo4j import GraphDatabase
-        driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_username, settings.neo4j_password)
-        )
-        
-        from src.retrieval.hierarchical_retriever import HierarchicalRetriever
-        retriever = HierarchicalRetriever(driver)
-        
-        # Get detailed retrieval result
-        retrieval_result = retriever.retrieve(request.question, top_k=5)
-        
-        # Generate answer
-        from openai import OpenAI
-        openai_client = OpenAI(api_key=settings.openai_api_key)
-        
+        retriever = get_hierarchical_retriever()
+
+        # Get detailed retrieval result (blocking embedding + Neo4j + LLM calls)
+        retrieval_result = await run_blocking(retriever.retrieve, request.question, top_k=5)
+
         if retrieval_result['selected_article']:
             context = retrieval_result['context']
-            
-            response = openai_client.chat.completions.create(
-                model=settings.llm_model,
-                messages=[
-                    {"role": "system", "content": "당신은 보험약관 전문가입니다."},
-                    {"role": "user", "content": f"약관 내용:\n\n{context}\n\n질문: {request.question}\n\n답변:"}
-                ],
-                temperature=0.3
+
+            answer_messages = [
+                {"role": "system", "content": "당신은 보험약관 전문가입니다."},
+                {"role": "user", "content": f"약관 내용:\n\n{context}\n\n질문: {request.question}\n\n답변:"}
+            ]
+
+            async def fetch_ref_texts(article_ids: List[str]) -> Dict[str, str]:
+                """Fetch texts for all referenced Articles in a single query"""
+                async with get_async_neo4j_driver().session() as ref_session:
+                    records = await _read_records(
+                        ref_session, CYPHER_ARTICLE_TEXTS_BY_ID, ids=article_ids
+                    )
+                    return {
+                        record['id']: record['text'][:200] if record['text'] else ""
+                        for record in records
+                    }
+
+            async def build_process_and_citations():
+                """Assemble process info and citations from the retrieval result"""
+                # Build process information
+                process = None
+                if request.include_process:
+                    # Combine sources (main article) with references for visualization
+                    all_sources = retrieval_result['sources'].copy()
+
+                    # Get references from hierarchical retriever context data
+                    context_data = await run_blocking(
+                        retriever._build_context_with_references,
+                        retrieval_result['selected_article']['articleId']
+                    )
+
+                    # Add references to sources for graph visualization
+                    for ref in context_data.get('references', []):
+                        all_sources.append({
+                            'type': ref['type'],
+                            'id': ref['id'],
+                            'title': ref.get('title', '')
+                        })
+
+                    process = {
+                        "candidates_count": retrieval_result['metadata']['candidates_count'],
+                        "articles_evaluated": retrieval_result['metadata']['articles_count'],
+                        "selected_article": {
+                            "id": retrieval_result['selected_article']['articleId'],
+                            "title": retrieval_result['selected_article']['title']
+                        },
+                        "references": len(context_data.get('references', [])),
+                        "sources": all_sources
+                    }
+
+                # Build citations including main article and references
+                citations = [{
+                    "clause_id": retrieval_result['selected_article']['articleId'],
+                    "title": retrieval_result['selected_article']['title'],
+                    "text": retrieval_result['selected_article']['text_preview']
+                }]
+
+                # Fetch all referenced Article texts in one round-trip
+                references = context_data.get('references', [])
+                article_ids = [ref['id'] for ref in references if ref['type'] == 'Article']
+                ref_texts = await fetch_ref_texts(article_ids) if article_ids else {}
+
+                for ref in references:
+                    citations.append({
+                        "clause_id": ref['id'],
+                        "title": ref.get('title', ''),
+                        "text": ref_texts.get(ref['id'], "")
+                    })
+
+                return process, citations
+
+            if wants_stream:
+                process, citations = await build_process_and_citations()
+                async def generate():
+                    # Tokens ship as they decode; metadata rides one final event
+                    answer_stream = await get_async_openai_client().chat.completions.create(
+                        model=settings.llm_model,
+                        messages=answer_messages,
+                        temperature=0.3,
+                        stream=True
+                    )
+                    async for chunk in answer_stream:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            yield f"data: {json.dumps({'delta': delta})}\n\n"
+                    yield f"data: {json.dumps({'citations': citations, 'process': process, 'intent': 'clause_detail', 'confidence': 0.9})}\n\n"
+
+                return StreamingResponse(
+                    generate(),
+                    media_type="text/event-stream",
+                    headers={
+                        "Cache-Control": "no-cache",
+                        "Connection": "keep-alive",
+                        "X-Accel-Buffering": "no"
+                    }
+                )
+
+            # The answer LLM call only needs the retrieval context while the
+            # process/citation queries only need the retrieval result, so the
+            # two round-trips can overlap instead of running back-to-back
+            (process, citations), response = await asyncio.gather(
+                build_process_and_citations(),
+                get_async_openai_client().chat.completions.create(
+                    model=settings.llm_model,
+                    messages=answer_messages,
+                    temperature=0.3
+                )
             )
-            
+
             answer = response.choices[0].message.content
-            
-            # Build process information
-            process = None
-            if request.include_process:
-                # Combine sources (main article) with references for visualization
-                all_sources = retrieval_result['sources'].copy()
-                
-                # Get references from hierarchical retriever context data
-                from src.retrieval.hierarchical_retriever import HierarchicalRetriever
-                context_data = retriever._build_context_with_references(
-                    retrieval_result['selected_article']['articleId']
-                )
-                
-                # Add references to sources for graph visualization
-                for ref in context_data.get('references', []):
-                    all_sources.append({
-                        'type': ref['type'],
-                        'id': ref['id'],
-                        'title': ref.get('title', '')
-                    })
-                
-                process = {
-                    "candidates_count": retrieval_result['metadata']['candidates_count'],
-                    "articles_evaluated": retrieval_result['metadata']['articles_count'],
-                    "selected_article": {
-                        "id": retrieval_result['selected_article']['articleId'],
-                        "title": retrieval_result['selected_article']['title']
-                    },
-                    "references": len(context_data.get('references', [])),
-                    "sources": all_sources
-                }
-            
-            driver.close()
-            
-            # Build citations including main article and references
-            citations = [{
-                "clause_id": retrieval_result['selected_article']['articleId'],
-                "title": retrieval_result['selected_article']['title'],
-                "text": retrieval_result['selected_article']['text'][:200]
-            }]
-            
-            # Add referenced clauses to citations
-            for ref in context_data.get('references', []):
-                # Get full text for the reference if available
-                ref_text = ""
-                with GraphDatabase.driver(
-                    settings.neo4j_uri,
-                    auth=(settings.neo4j_username, settings.neo4j_password)
-                ) as temp_driver:
-                    with temp_driver.session() as temp_session:
-                        if ref['type'] == 'Article':
-                            ref_result = temp_session.run("""
-                                MATCH (a:Article {articleId: $ref_id})
-                                RETURN a.text AS text
-                            """, ref_id=ref['id'])
-                            record = ref_result.single()
-                            if record:
-                                ref_text = record['text'][:200] if record['text'] else ""
-                
-                citations.append({
-                    "clause_id": ref['id'],
-                    "title": ref.get('title', ''),
-                    "text": ref_text
-                })
-            
+
             return DetailedQueryResponse(
                 question=request.question,
                 answer=answer,
@@ -413,7 +953,6 @@ async def query_detailed(request: DetailedQueryRequest):
                 process=process
             )
         else:
-            driver.close()
             return DetailedQueryResponse(
                 question=request.question,
                 answer="관련 조항을 찾을 수 없습니다.",
@@ -445,99 +984,158 @@ async def upload_pdf(file: UploadFile = File(...)):
         filename = f"{file_id}_{file.filename}"
         file_path = UPLOAD_DIR / filename
         
-        # Save file
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-        
+        # Save file - stream in 1 MB chunks so a large PDF never sits
+        # fully in memory and disk writes yield to the event loop
+        max_size = settings.max_upload_size_mb * 1024 * 1024
+        size = 0
+        too_large = False
+        async with aiofiles.open(file_path, "wb") as buffer:
+            while chunk := await file.read(1 << 20):
+                size += len(chunk)
+                if size > max_size:
+                    # Short-circuit mid-stream instead of filling the disk
+                    too_large = True
+                    break
+                await buffer.write(chunk)
+
+        if too_large:
+            os.remove(file_path)
+            raise HTTPException(
+                status_code=413,
+                detail=f"File exceeds the {settings.max_upload_size_mb} MB upload limit"
+            )
+
         logger.info(f"PDF uploaded: {filename}")
-        
+
         return {
             "file_id": file_id,
             "filename": file.filename,
             "path": str(file_path),
-            "size": len(content)
+            "size": size
         }
-    
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading file: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def run_ingestion(job_id: str, pdf_path: str, product_code: str, 
+def _read_progress(progress_file: str) -> Optional[Dict[str, Any]]:
+    """Read the ingestion progress JSON, tolerating partial writes"""
+    try:
+        if os.path.exists(progress_file):
+            with open(progress_file, 'r') as f:
+                return json.load(f)
+    except Exception as e:
+        logger.debug(f"Progress read error: {e}")
+    return None
+
+
+async def watch_progress(job_id: str, progress_file: str, done: asyncio.Event):
+    """Push progress file updates into ingestion_jobs until `done` is set.
+
+    Uses inotify (event-driven, no wakeups between writes) when available,
+    otherwise falls back to a 0.5s poll.
+    """
+    if Inotify is None:
+        while not done.is_set():
+            progress = _read_progress(progress_file)
+            if progress:
+                await ingestion_jobs.update(job_id, progress=progress)
+            try:
+                await asyncio.wait_for(done.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
+        return
+
+    # Watch the parent directory: the progress file may not exist yet
+    target = Path(progress_file).name
+    done_task = asyncio.create_task(done.wait())
+    with Inotify() as inotify:
+        inotify.add_watch(str(Path(progress_file).parent), Mask.CLOSE_WRITE | Mask.MOVED_TO)
+        events = inotify.__aiter__()
+        while not done.is_set():
+            event_task = asyncio.create_task(events.__anext__())
+            finished, _ = await asyncio.wait(
+                {event_task, done_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if event_task not in finished:
+                event_task.cancel()
+                break
+            event = event_task.result()
+            if event.name and str(event.name) == target:
+                progress = _read_progress(progress_file)
+                if progress:
+                    await ingestion_jobs.update(job_id, progress=progress)
+    done_task.cancel()
+
+
+async def run_ingestion(job_id: str, pdf_path: str, product_code: str,
                        product_name: str, version_id: str, max_clauses: Optional[int],
                        progress_file: str):
     """Background task for ingestion"""
-    import json
-    
     try:
-        ingestion_jobs[job_id]["status"] = "processing"
-        ingestion_jobs[job_id]["progress"] = {"stage": "PDF 파싱 준비 중...", "percent": 5, "detail": ""}
-        
-        # Get absolute paths
-        project_root = Path(__file__).parent.parent.parent.resolve()
-        script_path = project_root / "scripts" / "ingest_hierarchical.py"
-        abs_pdf_path = Path(pdf_path).resolve()
-        
-        cmd = [
-            "python3", str(script_path),
-            "--pdf", str(abs_pdf_path),
-            "--product-code", product_code,
-            "--product-name", product_name,
-            "--version-id", version_id,
-            "--progress-file", progress_file
-        ]
-        
-        if max_clauses:
-            cmd.extend(["--max-clauses", str(max_clauses)])
-        
-        logger.info(f"Running ingestion: {' '.join(cmd)}")
-        
-        # Use asyncio subprocess for non-blocking execution
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(project_root)
-        )
-        
-        # Monitor progress file while process is running
-        while process.returncode is None:
+        if INGEST_SEM.locked():
+            # Both worker slots are busy — surface that instead of showing
+            # the job stuck at "pending"
+            await ingestion_jobs.update(
+                job_id,
+                status="queued",
+                progress={"stage": "대기 중...", "percent": 0, "detail": "앞선 작업이 끝나기를 기다리고 있습니다."}
+            )
+
+        async with INGEST_SEM:
+            await ingestion_jobs.update(
+                job_id,
+                status="processing",
+                progress={"stage": "PDF 파싱 준비 중...", "percent": 5, "detail": ""}
+            )
+
+            abs_pdf_path = Path(pdf_path).resolve()
+            logger.info(f"Running ingestion for {abs_pdf_path} (job {job_id})")
+
+            # Run the ingestion function in a warm worker process — no
+            # interpreter startup or heavy re-imports per job. Progress still
+            # flows through the file, watched while the job runs.
+            done = asyncio.Event()
+            watcher = asyncio.create_task(watch_progress(job_id, progress_file, done))
+            error_msg = None
             try:
-                if os.path.exists(progress_file):
-                    with open(progress_file, 'r') as f:
-                        progress_data = json.load(f)
-                        ingestion_jobs[job_id]["progress"] = progress_data
+                await asyncio.get_running_loop().run_in_executor(
+                    get_ingest_pool(), ingest,
+                    str(abs_pdf_path), product_code, product_name, version_id,
+                    max_clauses, progress_file
+                )
             except Exception as e:
-                logger.debug(f"Progress read error: {e}")
-            await asyncio.sleep(0.5)
-            
-            # Check if process has completed
-            try:
-                await asyncio.wait_for(process.wait(), timeout=0.1)
-            except asyncio.TimeoutError:
-                pass
-        
-        # Get final result
-        stdout, stderr = await process.communicate()
-        
-        if process.returncode == 0:
-            ingestion_jobs[job_id]["status"] = "completed"
-            ingestion_jobs[job_id]["progress"] = {"stage": "완료!", "percent": 100, "detail": "모든 작업이 성공적으로 완료되었습니다."}
-            logger.info(f"Ingestion job {job_id} completed")
-        else:
-            ingestion_jobs[job_id]["status"] = "failed"
-            error_msg = stderr.decode() if stderr else "Unknown error"
-            ingestion_jobs[job_id]["error"] = error_msg
-            logger.error(f"Ingestion job {job_id} failed: {error_msg}")
-        
-        # Cleanup progress file
-        if os.path.exists(progress_file):
-            os.remove(progress_file)
-    
+                error_msg = str(e)
+            finally:
+                done.set()
+                await watcher
+
+            # Pick up the final write in case it raced the watcher shutdown
+            progress = _read_progress(progress_file)
+            if progress:
+                await ingestion_jobs.update(job_id, progress=progress)
+
+            if error_msg is None:
+                await ingestion_jobs.update(
+                    job_id,
+                    status="completed",
+                    progress={"stage": "완료!", "percent": 100, "detail": "모든 작업이 성공적으로 완료되었습니다."}
+                )
+                invalidate_recommended_queries_cache()
+                logger.info(f"Ingestion job {job_id} completed")
+            else:
+                await ingestion_jobs.update(job_id, status="failed", error=error_msg)
+                logger.error(f"Ingestion job {job_id} failed: {error_msg}")
+
+            # Cleanup progress file
+            if os.path.exists(progress_file):
+                os.remove(progress_file)
+
     except Exception as e:
-        ingestion_jobs[job_id]["status"] = "failed"
-        ingestion_jobs[job_id]["error"] = str(e)
+        await ingestion_jobs.update(job_id, status="failed", error=str(e))
         logger.error(f"Ingestion job {job_id} error: {e}")
 
 
@@ -547,30 +1145,17 @@ async def check_existing_nodes():
     Check if there are existing nodes in Neo4j
     """
     try:
-        from neo4j import GraphDatabase
-        driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_username, settings.neo4j_password)
-        )
-        
-        with driver.session() as session:
-            result = session.run("""
-                MATCH (n)
-                WITH labels(n) AS labels, count(*) AS count
-                RETURN labels[0] AS label, count
-                ORDER BY count DESC
-            """)
-            
+        async with get_async_neo4j_driver().session() as session:
+            records = await _read_records(session, CYPHER_NODE_COUNTS)
+
             nodes = {}
             total = 0
-            for record in result:
+            for record in records:
                 label = record['label']
                 count = record['count']
                 nodes[label] = count
                 total += count
-        
-        driver.close()
-        
+
         return {
             "has_existing": total > 0,
             "total_nodes": total,
@@ -588,17 +1173,15 @@ async def clear_graph():
     Clear all nodes from Neo4j
     """
     try:
-        from neo4j import GraphDatabase
-        driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_username, settings.neo4j_password)
-        )
-        
-        with driver.session() as session:
+        async def delete_all(tx):
+            result = await tx.run(CYPHER_CLEAR_GRAPH)
+            await result.consume()
+
+        async with get_async_neo4j_driver().session() as session:
             # Delete all nodes and relationships
-            session.run("MATCH (n) DETACH DELETE n")
-        
-        driver.close()
+            await session.execute_write(delete_all)
+
+        invalidate_recommended_queries_cache()
         logger.info("Graph cleared successfully")
         
         return {"status": "success", "message": "All nodes deleted"}
@@ -637,7 +1220,7 @@ async def start_ingestion(
         # Create progress file path
         progress_file = Path(f"/tmp/ingestion_progress_{job_id}.json")
         
-        ingestion_jobs[job_id] = {
+        await ingestion_jobs.set(job_id, {
             "status": "pending",
             "file_id": file_id,
             "pdf_path": pdf_path,
@@ -645,20 +1228,33 @@ async def start_ingestion(
             "progress": {"stage": "초기화 중...", "percent": 0, "detail": ""},
             "progress_file": str(progress_file),
             "error": None
-        }
-        
-        # Start background task
-        background_tasks.add_task(
-            run_ingestion,
-            job_id,
-            pdf_path,
-            request.product_code,
-            request.product_name,
-            request.version_id,
-            request.max_clauses,
-            str(progress_file)
-        )
+        })
         
+        # Durable path: with Redis + arq the job lands on a persistent queue
+        # and survives API worker restarts; otherwise it runs in-process
+        if create_pool is not None and settings.redis_url:
+            await (await get_arq_pool()).enqueue_job(
+                "ingest_task",
+                job_id,
+                pdf_path,
+                request.product_code,
+                request.product_name,
+                request.version_id,
+                request.max_clauses,
+                str(progress_file)
+            )
+        else:
+            background_tasks.add_task(
+                run_ingestion,
+                job_id,
+                pdf_path,
+                request.product_code,
+                request.product_name,
+                request.version_id,
+                request.max_clauses,
+                str(progress_file)
+            )
+
         logger.info(f"Ingestion job {job_id} started")
         
         return IngestionStatus(
@@ -680,11 +1276,10 @@ async def get_ingestion_status(job_id: str):
     
     - **job_id**: Ingestion job ID
     """
-    if job_id not in ingestion_jobs:
+    job = await ingestion_jobs.get(job_id)
+    if job is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = ingestion_jobs[job_id]
-    
+
     return IngestionStatus(
         job_id=job_id,
         status=job["status"],
@@ -700,77 +1295,43 @@ async def get_recommended_queries():
     
     Returns queries that require multi-clause traversal
     """
+    global _recommended_queries_cache, _recommended_queries_cached_at
+
+    # Serve from cache - the answer only changes when the graph is re-ingested
+    if (_recommended_queries_cache is not None
+            and time.monotonic() - _recommended_queries_cached_at < RECOMMENDED_QUERIES_TTL):
+        return _recommended_queries_cache
+
     # Generate recommended queries using LLM
     try:
-        from neo4j import GraphDatabase
-        from openai import OpenAI
-        
-        driver = GraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_username, settings.neo4j_password)
-        )
-        
         # Get articles with REFERS_TO relationships
-        with driver.session() as session:
-            result = session.run("""
-                MATCH (a:Article)-[:HAS_PARAGRAPH]->(p:Paragraph)-[r:REFERS_TO]->(ref)
-                RETURN DISTINCT a.articleId as article_id, 
-                       a.title as article_title,
-                       labels(ref)[0] as ref_type,
-                       CASE 
-                         WHEN ref.articleId IS NOT NULL THEN ref.articleId
-                         WHEN ref.paragraphId IS NOT NULL THEN ref.paragraphId
-                         ELSE ref.itemId
-                       END as ref_id
-                LIMIT 10
-            """)
-            
-            references = list(result)
-        
-        driver.close()
-        
+        async with get_async_neo4j_driver().session() as session:
+            references = await _read_records(session, CYPHER_REFERS_TO_SAMPLE, limit=10)
+
         if not references:
             return {"queries": []}
-        
+
         # Generate queries using LLM
-        openai_client = OpenAI(api_key=settings.openai_api_key)
-        
         references_text = "\n".join([
             f"- {ref['article_id']} ({ref['article_title']}) → {ref['ref_id']}"
             for ref in references[:5]
         ])
         
-        prompt = f"""다음은 보험약관에서 서로 참조하는 조항들입니다:
-
-{references_text}
-
-위 참조 관계를 활용하여, 답변하기 위해 여러 조항을 함께 읽어야 하는 질문 3개를 생성해주세요.
-
-응답 형식 (JSON):
-{{
-  "queries": [
-    {{
-      "question": "질문 내용",
-      "description": "이 질문이 왜 여러 조항을 필요로 하는지 간단한 설명",
-      "expected_clauses": ["제X조", "제Y조"]
-    }}
-  ]
-}}
-"""
-        
-        response = openai_client.chat.completions.create(
+        response = await get_async_openai_client().chat.completions.create(
             model=settings.llm_model,
             messages=[
-                {"role": "system", "content": "당신은 보험약관 전문가입니다."},
-                {"role": "user", "content": prompt}
+                {"role": "system", "content": RECOMMEND_SYSTEM},
+                {"role": "user", "content": RECOMMEND_INSTRUCTION + references_text}
             ],
             temperature=0.7,
             response_format={"type": "json_object"}
         )
-        
-        import json
+
         result = json.loads(response.choices[0].message.content)
-        
+
+        _recommended_queries_cache = result
+        _recommended_queries_cached_at = time.monotonic()
+
         return result
     
     except Exception as e:
@@ -792,10 +1353,6 @@ async def get_recommended_queries():
         }
 
 
-from fastapi.responses import StreamingResponse
-import json
-import re
-
 @app.post("/api/v1/query/stream")
 async def query_stream(request: DetailedQueryRequest):
     """
@@ -803,21 +1360,14 @@ async def query_stream(request: DetailedQueryRequest):
     """
     async def generate():
         try:
-            import numpy as np
-            from neo4j import GraphDatabase
-            from openai import OpenAI
-            
-            driver = GraphDatabase.driver(
-                settings.neo4j_uri,
-                auth=(settings.neo4j_username, settings.neo4j_password)
-            )
-            openai_client = OpenAI(api_key=settings.openai_api_key)
+            driver = get_neo4j_driver()
+            openai_client = get_async_openai_client()
             
             # Step 1: Generate query embedding
             yield f"data: {json.dumps({'step': 1, 'stage': '질문 분석 중...', 'detail': request.question[:50], 'percent': 10})}\n\n"
             await asyncio.sleep(0.1)
             
-            response = openai_client.embeddings.create(
+            response = await openai_client.embeddings.create(
                 model=settings.embedding_model,
                 input=request.question
             )
@@ -918,7 +1468,7 @@ async def query_stream(request: DetailedQueryRequest):
 
 가장 관련있는 조항 ID만 답하세요 (예: 제6조):"""
 
-                        selection_response = openai_client.chat.completions.create(
+                        selection_response = await openai_client.chat.completions.create(
                             model=settings.llm_model,
                             messages=[{"role": "user", "content": selection_prompt}],
                             temperature=0.1,
@@ -933,7 +1483,6 @@ async def query_stream(request: DetailedQueryRequest):
                 yield f"data: {json.dumps({'step': 4, 'stage': '최적 조항 선별 완료', 'status': 'completed', 'percent': 65, 'selected_article': selected_article_id})}\n\n"
             else:
                 yield f"data: {json.dumps({'step': 4, 'stage': '관련 조항 없음', 'status': 'warning', 'percent': 65})}\n\n"
-                driver.close()
                 yield f"data: {json.dumps({'step': 6, 'stage': '완료', 'percent': 100, 'result': {'answer': '관련 조항을 찾을 수 없습니다.', 'citations': [], 'confidence': 0}})}\n\n"
                 return
             
@@ -1002,14 +1551,8 @@ async def query_stream(request: DetailedQueryRequest):
 
 답변:"""
 
-            answer_response = openai_client.chat.completions.create(
-                model=settings.llm_model,
-                messages=[{"role": "user", "content": answer_prompt}],
-                temperature=0.3
-            )
-            
-            answer = answer_response.choices[0].message.content
-            
+            # Citations only depend on retrieval, so ship them before the
+            # answer starts streaming
             citations = []
             if main_record:
                 citations.append({
@@ -1023,9 +1566,27 @@ async def query_stream(request: DetailedQueryRequest):
                     'title': ref['title'],
                     'text': ref['text'][:200]
                 })
-            
-            driver.close()
-            
+
+            yield f"data: {json.dumps({'step': 6, 'stage': '답변 생성 중...', 'percent': 88, 'citations': citations})}\n\n"
+
+            # Stream answer tokens as they are produced so the client sees
+            # text after retrieval time, not after the full completion
+            answer_stream = await openai_client.chat.completions.create(
+                model=settings.llm_model,
+                messages=[{"role": "user", "content": answer_prompt}],
+                temperature=0.3,
+                stream=True
+            )
+
+            answer_parts = []
+            async for chunk in answer_stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    answer_parts.append(delta)
+                    yield f"data: {json.dumps({'step': 6, 'stage': 'streaming', 'percent': 90, 'token': delta})}\n\n"
+
+            answer = "".join(answer_parts)
+
             # Build sources for graph visualization
             sources = []
             if main_record:
@@ -1067,11 +1628,22 @@ async def query_stream(request: DetailedQueryRequest):
 
 if __name__ == "__main__":
     import uvicorn
-    
+
+    # Multi-process workers bypass the GIL for the Python-heavy retrieval
+    # path; uvloop/httptools speed up the event loop and HTTP parsing.
+    # Reload implies a single worker, so it is only enabled in debug mode.
     uvicorn.run(
-        "main:app",
+        "src.api.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True
+        workers=int(os.getenv("WEB_CONCURRENCY", 4)),
+        loop="uvloop",
+        http="httptools",
+        # Shed load instead of queueing behind multi-second LLM calls:
+        # excess requests get an immediate 503 rather than a late timeout
+        limit_concurrency=settings.max_concurrency,
+        backlog=128,
+        timeout_keep_alive=5,
+        reload=settings.debug
     )
 
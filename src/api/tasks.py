@@ -0,0 +1,38 @@
+"""
+arq task definitions for durable ingestion jobs
+
+Run a worker alongside the API with:
+
+    arq src.api.tasks.WorkerSettings
+
+Requires REDIS_URL; the API enqueues ingestion jobs here when arq and
+Redis are available, so jobs survive API worker restarts and can be
+retried or scaled independently. Without them the API falls back to
+in-process BackgroundTasks.
+"""
+from typing import Optional
+
+from arq.connections import RedisSettings
+
+from src.config.settings import settings
+
+
+async def ingest_task(ctx, job_id: str, pdf_path: str, product_code: str,
+                      product_name: str, version_id: str,
+                      max_clauses: Optional[int], progress_file: str):
+    """Run one ingestion job; mirrors the API's run_ingestion"""
+    # Imported lazily so the worker only pulls in the API module (and its
+    # startup imports) when it actually runs a job
+    from src.api.main import run_ingestion
+
+    await run_ingestion(job_id, pdf_path, product_code, product_name,
+                        version_id, max_clauses, progress_file)
+
+
+class WorkerSettings:
+    """arq worker configuration"""
+    functions = [ingest_task]
+    redis_settings = RedisSettings.from_dsn(settings.redis_url or "redis://localhost:6379")
+    max_jobs = 2  # Matches the ingestion process pool
+    job_timeout = 3600
+    max_tries = 2
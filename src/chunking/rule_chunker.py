@@ -2,13 +2,15 @@
 Rule-based Chunker for Insurance Policy Documents
 Chunks based on structural rules (조/항/호)
 """
-from typing import List, Dict, Any, Optional
+import io
+from collections import Counter, defaultdict
+from typing import Iterable, List, Dict, Any, Optional
 from dataclasses import dataclass
 from loguru import logger
 from src.parsers.clause_extractor import Clause
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleChunk:
     """Represents a rule-based chunk"""
     chunk_id: str
@@ -34,20 +36,46 @@ class RuleBasedChunker:
         """
         self.max_chunk_size = max_chunk_size
         self.chunks: List[RuleChunk] = []
-    
-    def chunk_clauses(self, clauses: List[Clause]) -> List[RuleChunk]:
+        self._by_clause: Dict[str, List[RuleChunk]] = defaultdict(list)
+        self._reset_stats()
+
+    def _reset_stats(self):
+        """Zero the running size/type aggregates"""
+        self._size_sum = 0
+        self._size_min = float('inf')
+        self._size_max = 0
+        self._type_counts: Counter = Counter()
+
+    def _add_chunk(self, chunk: RuleChunk):
+        """Append a chunk, keeping the clause index and running stats in sync"""
+        self.chunks.append(chunk)
+        if chunk.clause_id:
+            self._by_clause[chunk.clause_id].append(chunk)
+
+        size = len(chunk.content)
+        self._size_sum += size
+        self._size_min = min(self._size_min, size)
+        self._size_max = max(self._size_max, size)
+        self._type_counts[chunk.chunk_type] += 1
+
+    def chunk_clauses(self, clauses: Iterable[Clause]) -> List[RuleChunk]:
         """
         Create chunks from extracted clauses
-        
+
         Args:
-            clauses: List of extracted Clause objects
-            
+            clauses: Iterable of extracted Clause objects; a generator is
+                fine — clauses are consumed one at a time
+
         Returns:
             List of RuleChunk objects
         """
         self.chunks = []
-        
+        self._by_clause.clear()
+        self._reset_stats()
+
+        clause_count = 0
         for clause in clauses:
+            clause_count += 1
             # Check if clause is too large
             if len(clause.full_text) > self.max_chunk_size:
                 # Split into sub-chunks based on items
@@ -73,9 +101,9 @@ class RuleBasedChunker:
                     },
                     clause_id=clause.clause_id
                 )
-                self.chunks.append(chunk)
-        
-        logger.info(f"✅ Created {len(self.chunks)} rule-based chunks from {len(clauses)} clauses")
+                self._add_chunk(chunk)
+
+        logger.info(f"✅ Created {len(self.chunks)} rule-based chunks from {clause_count} clauses")
         return self.chunks
     
     def _chunk_large_clause_by_items(self, clause: Clause):
@@ -85,16 +113,26 @@ class RuleBasedChunker:
         Args:
             clause: Clause object to split
         """
-        # Create header chunk with clause title and intro
+        # Create header chunk with clause title and intro. Read at most the
+        # first few lines without splitting the whole text, and track the
+        # joined length as a running count instead of re-joining per line.
+        buf = io.StringIO(clause.full_text)
         header_lines = []
-        full_lines = clause.full_text.split('\n')
-        
-        for line in full_lines[:5]:  # Take first few lines as header
+        header_len = 0
+
+        for _ in range(5):  # Take first few lines as header
+            line = buf.readline()
+            if not line:
+                break
+            line = line.rstrip('\n')
             if line.strip():
+                if header_lines:
+                    header_len += 1  # joining newline
                 header_lines.append(line)
-            if len('\n'.join(header_lines)) > 200:
+                header_len += len(line)
+            if header_len > 200:
                 break
-        
+
         header_text = '\n'.join(header_lines)
         
         # Create header chunk
@@ -111,7 +149,7 @@ class RuleBasedChunker:
             },
             clause_id=clause.clause_id
         )
-        self.chunks.append(header_chunk)
+        self._add_chunk(header_chunk)
         
         # Create chunks for each item
         for idx, item in enumerate(clause.items):
@@ -129,7 +167,7 @@ class RuleBasedChunker:
                 clause_id=clause.clause_id,
                 parent_id=f"{clause.clause_id}_header"
             )
-            self.chunks.append(item_chunk)
+            self._add_chunk(item_chunk)
         
         logger.debug(f"Split {clause.clause_id} into 1 header + {len(clause.items)} items")
     
@@ -141,45 +179,18 @@ class RuleBasedChunker:
             clause: Clause object to split
         """
         paragraphs = [p.strip() for p in clause.full_text.split('\n\n') if p.strip()]
-        
-        current_chunk_text = []
+
+        # Accumulate paragraphs into a buffer and track the running size so
+        # flushing a chunk never re-joins the accumulated text
+        buf = io.StringIO()
         current_chunk_size = 0
         chunk_counter = 0
-        
-        for para in paragraphs:
-            para_size = len(para)
-            
-            if current_chunk_size + para_size > self.max_chunk_size and current_chunk_text:
-                # Save current chunk
-                chunk = RuleChunk(
-                    chunk_id=f"{clause.clause_id}_para_{chunk_counter}",
-                    chunk_type="paragraph",
-                    content='\n\n'.join(current_chunk_text),
-                    metadata={
-                        'clause_id': clause.clause_id,
-                        'title': clause.title,
-                        'clause_type': clause.clause_type,
-                        'section_path': clause.section_path,
-                        'paragraph_group': chunk_counter
-                    },
-                    clause_id=clause.clause_id
-                )
-                self.chunks.append(chunk)
-                
-                # Reset
-                current_chunk_text = [para]
-                current_chunk_size = para_size
-                chunk_counter += 1
-            else:
-            current_chunk_text.append(para)
-                current_chunk_size += para_size
-        
-        # Save last chunk
-        if current_chunk_text:
+
+        def flush():
             chunk = RuleChunk(
                 chunk_id=f"{clause.clause_id}_para_{chunk_counter}",
                 chunk_type="paragraph",
-                content='\n\n'.join(current_chunk_text),
+                content=buf.getvalue(),
                 metadata={
                     'clause_id': clause.clause_id,
                     'title': clause.title,
@@ -189,8 +200,30 @@ class RuleBasedChunker:
                 },
                 clause_id=clause.clause_id
             )
-            self.chunks.append(chunk)
-        
+            self._add_chunk(chunk)
+
+        for para in paragraphs:
+            para_size = len(para)
+
+            if current_chunk_size + para_size > self.max_chunk_size and current_chunk_size:
+                # Save current chunk
+                flush()
+
+                # Reset
+                buf = io.StringIO()
+                buf.write(para)
+                current_chunk_size = para_size
+                chunk_counter += 1
+            else:
+                if current_chunk_size:
+                    buf.write('\n\n')
+                buf.write(para)
+                current_chunk_size += para_size
+
+        # Save last chunk
+        if current_chunk_size:
+            flush()
+
         logger.debug(f"Split {clause.clause_id} into {chunk_counter + 1} paragraph chunks")
     
     def create_table_chunk(self, table_text: str, metadata: Dict[str, Any]) -> RuleChunk:
@@ -210,7 +243,7 @@ class RuleBasedChunker:
             content=table_text,
             metadata=metadata
         )
-        self.chunks.append(chunk)
+        self._add_chunk(chunk)
         return chunk
     
     def get_chunks_by_clause(self, clause_id: str) -> List[RuleChunk]:
@@ -223,7 +256,7 @@ class RuleBasedChunker:
         Returns:
             List of chunks
         """
-        return [c for c in self.chunks if c.clause_id == clause_id]
+        return list(self._by_clause.get(clause_id, []))
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -232,32 +265,14 @@ class RuleBasedChunker:
         Returns:
             Dictionary of statistics
         """
-        stats = {
+        # Aggregates are maintained as chunks are appended, so this is O(1)
+        return {
             'total_chunks': len(self.chunks),
-            'chunks_by_type': {},
-            'avg_chunk_size': 0,
-            'max_chunk_size': 0,
-            'min_chunk_size': float('inf')
+            'chunks_by_type': dict(self._type_counts),
+            'avg_chunk_size': self._size_sum / len(self.chunks) if self.chunks else 0,
+            'max_chunk_size': self._size_max,
+            'min_chunk_size': self._size_min
         }
-        
-        chunk_sizes = []
-        
-        for chunk in self.chunks:
-            # Count by type
-            if chunk.chunk_type not in stats['chunks_by_type']:
-                stats['chunks_by_type'][chunk.chunk_type] = 0
-            stats['chunks_by_type'][chunk.chunk_type] += 1
-            
-            # Size stats
-            size = len(chunk.content)
-            chunk_sizes.append(size)
-            stats['max_chunk_size'] = max(stats['max_chunk_size'], size)
-            stats['min_chunk_size'] = min(stats['min_chunk_size'], size)
-        
-        if chunk_sizes:
-            stats['avg_chunk_size'] = sum(chunk_sizes) / len(chunk_sizes)
-        
-        return stats
     
     def to_dict(self) -> List[Dict[str, Any]]:
         """
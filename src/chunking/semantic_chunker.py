@@ -2,15 +2,126 @@
 LLM-based Semantic Chunker for Insurance Policy Documents
 Uses LLM to intelligently split complex clauses into semantic units
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+from collections import Counter, defaultdict
+from typing import Callable, List, Dict, Any, Iterator, Literal, Optional
 from dataclasses import dataclass
 from loguru import logger
-from openai import OpenAI
+from pydantic import BaseModel
+import httpx
+from openai import OpenAI, AsyncOpenAI
 import json
+import orjson
+import tiktoken
 from src.config.settings import settings
 
+# Bump whenever the split prompts change so stale cache entries are ignored
+PROMPT_VERSION = "2"
 
-@dataclass
+# Sentinel patterns for each semantic type; a clause matching exactly one
+# of these is classified without an LLM call
+# Metadata keys added while building a clause's result, carried over when
+# an identical-content result is cloned for another clause
+_RESULT_META_KEYS = ('label', 'reasoning', 'chunk_index', 'total_chunks',
+                     'llm_identified', 'classifier', 'reason', 'fallback_reason')
+
+_TYPE_PATTERNS = [
+    ('coverage', re.compile(r"보상하(는|여)\s*손해|지급하는\s*보험금")),
+    ('exclusion', re.compile(r"보상하지\s*아니하는|면책")),
+    ('deductible', re.compile(r"자기부담금")),
+    ('limit', re.compile(r"보상한도|최고한도액")),
+    ('definition', re.compile(r"용어의?\s*정의|란\s*.{1,80}(을|를)\s*(말한다|의미한다)")),
+    ('procedure', re.compile(r"(청구|지급|계약)\s*절차")),
+]
+
+# Content-addressed cache of LLM responses: identical (model, prompt
+# version, clause text) tuples skip the API call entirely on re-runs
+_cache_conn = None
+
+
+def _get_cache() -> sqlite3.Connection:
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(settings.cache_dir, exist_ok=True)
+        _cache_conn = sqlite3.connect(
+            os.path.join(settings.cache_dir, "semantic_chunks.db"),
+            check_same_thread=False
+        )
+        _cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT)"
+        )
+        _cache_conn.commit()
+    return _cache_conn
+
+# Shared OpenAI clients: one TCP/TLS connection pool per process no
+# matter how many chunker instances pipelines construct, with HTTP/2
+# keep-alive so repeated calls skip the handshake
+_sync_client = None
+_async_client = None
+
+
+def _get_sync_client() -> OpenAI:
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = OpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+    return _sync_client
+
+
+def _get_async_client() -> AsyncOpenAI:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
+    return _async_client
+
+
+# Shared token encoder for prompt packing; loading it costs ~30ms so it
+# is built once per process
+_token_encoder = None
+
+
+def _get_token_encoder():
+    global _token_encoder
+    if _token_encoder is None:
+        try:
+            _token_encoder = tiktoken.encoding_for_model(settings.llm_model)
+        except KeyError:
+            _token_encoder = tiktoken.get_encoding("cl100k_base")
+    return _token_encoder
+
+
+class SemanticUnit(BaseModel):
+    """One sub-unit in a structured chunking response"""
+    label: str
+    semantic_type: Literal['coverage', 'exclusion', 'condition', 'deductible',
+                           'limit', 'definition', 'procedure', 'general']
+    content: str
+    reasoning: str
+
+
+class ChunkList(BaseModel):
+    """Structured Outputs schema for a single-clause split"""
+    chunks: List[SemanticUnit]
+
+
+@dataclass(slots=True)
 class SemanticChunk:
     """Represents a semantically coherent chunk"""
     chunk_id: str
@@ -19,6 +130,10 @@ class SemanticChunk:
     metadata: Dict[str, Any]
     parent_chunk_id: Optional[str] = None
 
+    @property
+    def char_count(self) -> int:
+        return len(self.content)
+
 
 class SemanticChunker:
     """
@@ -26,7 +141,10 @@ class SemanticChunker:
     into meaningful semantic units while preserving context
     """
     
-    SEMANTIC_SPLIT_PROMPT = """You are an expert at analyzing insurance policy documents in Korean.
+    # All static instructions live in the system message so every request
+    # shares a byte-identical prefix — OpenAI's automatic prompt caching
+    # can hit on it and only the small clause payload varies per call
+    SYSTEM_INSTRUCTIONS = """You are an expert at analyzing insurance policy documents in Korean.
 
 Your task is to:
 1. Carefully read the insurance policy clause
@@ -51,33 +169,70 @@ CRITICAL RULES:
 5. Each sub-unit should contain ONE semantic type
 
 Example:
-If a clause has "1. 보상하는 손해" and "2. 보상하지 아니하는 손해", 
+If a clause has "1. 보상하는 손해" and "2. 보상하지 아니하는 손해",
 split into two sub-units: one "coverage" and one "exclusion"
 
-Clause to analyze:
----
-Title: {title}
-Hint (may be inaccurate): {clause_type}
-
-Content:
-{content}
----
-
 Return a JSON object with a "chunks" array:
-{{
+{
   "chunks": [
-    {{
+    {
       "label": "brief descriptive label (2-4 words in Korean)",
       "semantic_type": "coverage|exclusion|condition|deductible|limit|definition|procedure|general",
       "content": "exact text from original (DO NOT modify)",
       "reasoning": "brief reason for this classification"
-    }}
+    }
   ]
-}}
+}
 
 If the entire clause represents a single semantic type, return one chunk with all content.
 """
-    
+
+    BATCH_SYSTEM_INSTRUCTIONS = """You are an expert at analyzing insurance policy documents in Korean.
+
+You will receive several separate policy clauses. For EACH clause:
+1. Carefully read the clause
+2. Identify the SEMANTIC TYPE of each distinct concept within it
+3. Split into semantically coherent sub-units if needed
+
+SEMANTIC TYPE DEFINITIONS:
+- "coverage": What IS covered/compensated (보상하는 손해, 지급하는 보험금)
+- "exclusion": What is NOT covered/excluded (보상하지 아니하는 손해, 면책사항)
+- "condition": Requirements, procedures, obligations (조건, 의무, 청구절차)
+- "deductible": Self-payment amounts (자기부담금)
+- "limit": Coverage limits, maximum amounts (보상한도, 최고한도액)
+- "definition": Term definitions (용어의 정의, 의미)
+- "procedure": Administrative procedures (절차, 방법)
+- "general": Other general provisions
+
+CRITICAL RULES:
+1. DO NOT summarize, paraphrase, or rewrite - preserve EXACT original text
+2. DO NOT change any wording
+3. Focus on ACCURATE semantic type identification
+4. Split ONLY when there are clearly different semantic types within one clause
+5. Each sub-unit should contain ONE semantic type
+6. Return one result per clause, keyed by its exact Clause ID
+
+Return a JSON object with a "results" array containing one entry per clause:
+{
+  "results": [
+    {
+      "clause_id": "the exact Clause ID given above",
+      "chunks": [
+        {
+          "label": "brief descriptive label (2-4 words in Korean)",
+          "semantic_type": "coverage|exclusion|condition|deductible|limit|definition|procedure|general",
+          "content": "exact text from original (DO NOT modify)",
+          "reasoning": "brief reason for this classification"
+        }
+      ]
+    }
+  ]
+}
+
+If a clause represents a single semantic type, return one chunk with all its content.
+"""
+
+
     def __init__(self, model: str = None):
         """
         Initialize semantic chunker
@@ -86,154 +241,464 @@ If the entire clause represents a single semantic type, return one chunk with al
             model: OpenAI model to use (default from settings)
         """
         self.model = model or settings.llm_model
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self.client = _get_sync_client()
+        self.async_client = _get_async_client()
         self.chunks: List[SemanticChunk] = []
         logger.info(f"Initialized SemanticChunker with model: {self.model}")
-    
+
+    def _cache_key(self, text: str) -> str:
+        """Content-addressed cache key for one clause text"""
+        return hashlib.blake2b(
+            f"{self.model}|{PROMPT_VERSION}|{text}".encode(), digest_size=16
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        row = _get_cache().execute(
+            "SELECT response FROM llm_responses WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _cache_put(self, key: str, response_text: str):
+        conn = _get_cache()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_responses (key, response) VALUES (?, ?)",
+            (key, response_text)
+        )
+        conn.commit()
+
+    def _build_messages(self, text: str, metadata: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Build the chat messages for the semantic split prompt"""
+        # The user payload is tiny; an f-string avoids rescanning a
+        # template for placeholders on every clause
+        user_content = (
+            "Clause to analyze:\n---\n"
+            f"Title: {metadata.get('title', 'N/A')}\n"
+            f"Hint (may be inaccurate): {metadata.get('clause_type') or 'Unknown'}\n\n"
+            f"Content:\n{text}\n---\n"
+        )
+
+        return [
+            {"role": "system", "content": self.SYSTEM_INSTRUCTIONS},
+            {"role": "user", "content": user_content}
+        ]
+
+    def _short_text_chunk(self, text: str, metadata: Dict[str, Any]) -> List[SemanticChunk]:
+        """Wrap short text as a single chunk without calling the LLM"""
+        chunk = SemanticChunk(
+            chunk_id=f"{metadata.get('clause_id', 'chunk')}_semantic_0",
+            content=text,
+            semantic_type='general',  # Default for short texts
+            metadata={
+                **metadata,
+                'llm_identified': False,
+                'reason': 'text_too_short'
+            }
+        )
+        return [chunk]
+
+    def _clone_chunks(self, chunks: List[SemanticChunk],
+                      metadata: Dict[str, Any]) -> List[SemanticChunk]:
+        """Re-key another clause's identical-content result to this clause"""
+        base_id = metadata.get('clause_id', 'chunk')
+        clones = []
+        for i, chunk in enumerate(chunks):
+            meta = {**metadata}
+            for key in _RESULT_META_KEYS:
+                if key in chunk.metadata:
+                    meta[key] = chunk.metadata[key]
+            clones.append(SemanticChunk(
+                chunk_id=f"{base_id}_semantic_{i}",
+                content=chunk.content,
+                semantic_type=chunk.semantic_type,
+                metadata=meta,
+                parent_chunk_id=base_id if chunk.parent_chunk_id is not None else None
+            ))
+        return clones
+
+    def _regex_chunk(self, text: str, metadata: Dict[str, Any]) -> Optional[List[SemanticChunk]]:
+        """Classify an unambiguous single-type clause without the LLM
+
+        Returns a single chunk when exactly one type's sentinel patterns
+        match the text, or None when the clause needs the LLM.
+        """
+        matched = [stype for stype, pattern in _TYPE_PATTERNS if pattern.search(text)]
+        if len(matched) != 1:
+            return None
+
+        chunk = SemanticChunk(
+            chunk_id=f"{metadata.get('clause_id', 'chunk')}_semantic_0",
+            content=text,
+            semantic_type=matched[0],
+            metadata={
+                **metadata,
+                'llm_identified': False,
+                'classifier': 'regex'
+            }
+        )
+        return [chunk]
+
+    def _fallback_chunk(self, text: str, metadata: Dict[str, Any], error: Exception) -> List[SemanticChunk]:
+        """Return original text as a single chunk when the LLM call fails"""
+        chunk = SemanticChunk(
+            chunk_id=f"{metadata.get('clause_id', 'chunk')}_semantic_0",
+            content=text,
+            semantic_type='general',  # Default to general on error
+            metadata={
+                **metadata,
+                'llm_identified': False,
+                'fallback_reason': str(error)
+            }
+        )
+        return [chunk]
+
+    def _chunks_from_response(self, result_text: str, text: str,
+                              metadata: Dict[str, Any]) -> List[SemanticChunk]:
+        """Parse the LLM JSON response and build SemanticChunk objects"""
+        # Parse JSON response
+        try:
+            # Handle both array and object formats
+            result = orjson.loads(result_text)
+            if isinstance(result, dict) and 'chunks' in result:
+                sub_units = result['chunks']
+            elif isinstance(result, dict) and 'sub_units' in result:
+                sub_units = result['sub_units']
+            elif isinstance(result, list):
+                sub_units = result
+            else:
+                # If unexpected format, treat whole text as single chunk
+                logger.warning(f"Unexpected JSON format from LLM. Using fallback.")
+                sub_units = [{
+                    'label': metadata.get('title', 'content'),
+                    'semantic_type': 'general',
+                    'content': text,
+                    'reasoning': 'fallback due to unexpected response format'
+                }]
+        except (orjson.JSONDecodeError, ValueError) as e:
+            logger.warning(f"Failed to parse LLM response as JSON: {e}. Using fallback.")
+            sub_units = [{
+                'label': metadata.get('title', 'content'),
+                'semantic_type': 'general',
+                'content': text,
+                'reasoning': 'fallback due to JSON parse error'
+            }]
+
+        return self._build_chunks(sub_units, metadata)
+
+    def _build_chunks(self, sub_units: List[Dict[str, Any]],
+                      metadata: Dict[str, Any]) -> List[SemanticChunk]:
+        """Create SemanticChunk objects from parsed sub-units"""
+        # Hot loop: bind lookups to locals and build in one comprehension
+        base_id = metadata.get('clause_id', 'chunk')
+        total = len(sub_units)
+        SC = SemanticChunk
+
+        chunks = [
+            SC(
+                chunk_id=f"{base_id}_semantic_{idx}",
+                content=unit.get('content', '').strip(),
+                semantic_type=unit.get('semantic_type', 'general'),
+                metadata={
+                    **metadata,
+                    'label': unit.get('label', ''),
+                    'reasoning': unit.get('reasoning', ''),
+                    'chunk_index': idx,
+                    'total_chunks': total,
+                    'llm_identified': True  # Mark that this was LLM-identified
+                },
+                parent_chunk_id=base_id
+            )
+            for idx, unit in enumerate(sub_units)
+        ]
+
+        logger.debug(f"Split {base_id} into {len(chunks)} semantic chunks with LLM-identified types")
+        return chunks
+
     def chunk_text(self, text: str, metadata: Dict[str, Any]) -> List[SemanticChunk]:
         """
         Split text into semantic chunks using LLM
-        
+
         Args:
             text: Text to chunk
             metadata: Metadata about the text (clause_id, title, type, etc.)
-            
+
         Returns:
             List of SemanticChunk objects
         """
-        # Skip if text is too short
-        if len(text) < 150:
-            chunk = SemanticChunk(
-                chunk_id=f"{metadata.get('clause_id', 'chunk')}_semantic_0",
-                content=text,
-                semantic_type='general',  # Default for short texts
-                metadata={
-                    **metadata,
-                    'llm_identified': False,
-                    'reason': 'text_too_short'
-                }
-            )
-            return [chunk]
-        
+        # Skip if the clause is too small to be worth splitting; token
+        # count tracks actual LLM cost better than characters for CJK text
+        if len(_get_token_encoder().encode(text)) < settings.semantic_min_tokens:
+            return self._short_text_chunk(text, metadata)
+
+        # Unambiguous single-type clauses skip the LLM entirely
+        pre_classified = self._regex_chunk(text, metadata)
+        if pre_classified is not None:
+            return pre_classified
+
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._chunks_from_response(cached, text, metadata)
+
         try:
-            # Call LLM to split text and identify semantic types
-            prompt = self.SEMANTIC_SPLIT_PROMPT.format(
-                title=metadata.get('title', 'N/A'),
-                clause_type=metadata.get('clause_type') or 'Unknown',
-                content=text
-            )
-            
-            response = self.client.chat.completions.create(
+            # Structured Outputs pin the response to the ChunkList schema,
+            # so no shape-sniffing or JSON-repair fallback is needed
+            response = self.client.beta.chat.completions.parse(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are an expert at analyzing Korean insurance policy documents. "
-                                   "Your expertise is in identifying semantic types (coverage/exclusion/condition/etc). "
-                                   "Always return valid JSON with accurate semantic_type classification."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self._build_messages(text, metadata),
                 temperature=0.1,
-                response_format={"type": "json_object"}
+                response_format=ChunkList
             )
-            
-            result_text = response.choices[0].message.content
-            
-            # Parse JSON response
-            try:
-                # Handle both array and object formats
-                result = json.loads(result_text)
-                if isinstance(result, dict) and 'chunks' in result:
-                    sub_units = result['chunks']
-                elif isinstance(result, dict) and 'sub_units' in result:
-                    sub_units = result['sub_units']
-                elif isinstance(result, list):
-                    sub_units = result
-                else:
-                    # If unexpected format, treat whole text as single chunk
-                    logger.warning(f"Unexpected JSON format from LLM. Using fallback.")
-                    sub_units = [{
-                        'label': metadata.get('title', 'content'),
-                        'semantic_type': 'general',
-                        'content': text,
-                        'reasoning': 'fallback due to unexpected response format'
-                    }]
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse LLM response as JSON: {e}. Using fallback.")
-                sub_units = [{
-                    'label': metadata.get('title', 'content'),
-                    'semantic_type': 'general',
-                    'content': text,
-                    'reasoning': 'fallback due to JSON parse error'
-                }]
-            
-            # Create SemanticChunk objects with LLM-identified types
-            chunks = []
-            base_id = metadata.get('clause_id', 'chunk')
-            
-            for idx, unit in enumerate(sub_units):
-                semantic_type = unit.get('semantic_type', 'general')
-                reasoning = unit.get('reasoning', '')
-                
-                chunk = SemanticChunk(
-                    chunk_id=f"{base_id}_semantic_{idx}",
-                    content=unit.get('content', '').strip(),
-                    semantic_type=semantic_type,
-                    metadata={
-                        **metadata,
-                        'label': unit.get('label', ''),
-                        'reasoning': reasoning,
-                        'chunk_index': idx,
-                        'total_chunks': len(sub_units),
-                        'llm_identified': True  # Mark that this was LLM-identified
-                    },
-                    parent_chunk_id=base_id
-                )
-                chunks.append(chunk)
-            
-            logger.debug(f"Split {base_id} into {len(chunks)} semantic chunks with LLM-identified types")
-            return chunks
-        
+
+            sub_units = [unit.model_dump() for unit in response.choices[0].message.parsed.chunks]
+            self._cache_put(key, json.dumps({'chunks': sub_units}, ensure_ascii=False))
+            return self._build_chunks(sub_units, metadata)
+
         except Exception as e:
             logger.error(f"Error in semantic chunking: {e}. Falling back to single chunk.")
-            # Fallback: return original text as single chunk
-            chunk = SemanticChunk(
-                chunk_id=f"{metadata.get('clause_id', 'chunk')}_semantic_0",
-                content=text,
-                semantic_type='general',  # Default to general on error
-            metadata={
-                    **metadata,
-                    'llm_identified': False,
-                    'fallback_reason': str(e)
-                }
+            return self._fallback_chunk(text, metadata, e)
+
+    async def chunk_text_async(self, text: str, metadata: Dict[str, Any]) -> List[SemanticChunk]:
+        """
+        Async variant of chunk_text for concurrent chunking of many clauses
+
+        Args:
+            text: Text to chunk
+            metadata: Metadata about the text (clause_id, title, type, etc.)
+
+        Returns:
+            List of SemanticChunk objects
+        """
+        # Skip if the clause is too small to be worth splitting; token
+        # count tracks actual LLM cost better than characters for CJK text
+        if len(_get_token_encoder().encode(text)) < settings.semantic_min_tokens:
+            return self._short_text_chunk(text, metadata)
+
+        # Unambiguous single-type clauses skip the LLM entirely
+        pre_classified = self._regex_chunk(text, metadata)
+        if pre_classified is not None:
+            return pre_classified
+
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return self._chunks_from_response(cached, text, metadata)
+
+        try:
+            response = await self.async_client.beta.chat.completions.parse(
+                model=self.model,
+                messages=self._build_messages(text, metadata),
+                temperature=0.1,
+                response_format=ChunkList
             )
-            return [chunk]
+
+            sub_units = [unit.model_dump() for unit in response.choices[0].message.parsed.chunks]
+            self._cache_put(key, json.dumps({'chunks': sub_units}, ensure_ascii=False))
+            return self._build_chunks(sub_units, metadata)
+
+        except Exception as e:
+            logger.error(f"Error in semantic chunking: {e}. Falling back to single chunk.")
+            return self._fallback_chunk(text, metadata, e)
     
     # Removed _infer_type_from_metadata - semantic types should be determined by LLM only
     
+    async def achunk_batch(self, items: List[Dict[str, Any]]) -> List[List[SemanticChunk]]:
+        """
+        Split several clauses in a single LLM call
+
+        Packing clauses into one request amortizes the instruction prompt
+        and the round-trip across the batch. Results are matched back to
+        the inputs by clause_id.
+
+        Args:
+            items: List of dicts with 'content' and 'metadata' keys
+
+        Returns:
+            One list of SemanticChunk objects per input item, in order
+        """
+        results: List[Optional[List[SemanticChunk]]] = [None] * len(items)
+
+        # Serve repeat clauses from the on-disk cache; only misses go
+        # into the batched prompt
+        misses = []
+        for idx, item in enumerate(items):
+            cached = self._cache_get(self._cache_key(item.get('content', '')))
+            if cached is not None:
+                results[idx] = self._chunks_from_response(
+                    cached, item.get('content', ''), item.get('metadata', {})
+                )
+            else:
+                misses.append(idx)
+
+        if not misses:
+            return results
+
+        sections = []
+        for idx in misses:
+            item = items[idx]
+            md = item.get('metadata', {})
+            sections.append(
+                f"Clause ID: {md.get('clause_id', 'chunk')}\n"
+                f"Title: {md.get('title', 'N/A')}\n"
+                f"Hint (may be inaccurate): {md.get('clause_type') or 'Unknown'}\n"
+                f"Content:\n{item.get('content', '')}"
+            )
+        user_content = (
+            f"{len(misses)} clauses to analyze:\n---\n" + "\n---\n".join(sections) + "\n---"
+        )
+
+        try:
+            response = await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": self.BATCH_SYSTEM_INSTRUCTIONS},
+                    {"role": "user", "content": user_content}
+                ],
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+            result = orjson.loads(response.choices[0].message.content)
+            by_clause = {
+                entry.get('clause_id'): entry.get('chunks', [])
+                for entry in result.get('results', [])
+            }
+        except Exception as e:
+            logger.error(f"Error in batched semantic chunking: {e}. Falling back to single chunks.")
+            for idx in misses:
+                results[idx] = self._fallback_chunk(
+                    items[idx].get('content', ''), items[idx].get('metadata', {}), e
+                )
+            return results
+
+        for idx in misses:
+            item = items[idx]
+            metadata = item.get('metadata', {})
+            sub_units = by_clause.get(metadata.get('clause_id', 'chunk'))
+            if sub_units:
+                results[idx] = self._build_chunks(sub_units, metadata)
+                self._cache_put(
+                    self._cache_key(item.get('content', '')),
+                    json.dumps({'chunks': sub_units}, ensure_ascii=False)
+                )
+            else:
+                # The model dropped this clause from its response
+                results[idx] = self._fallback_chunk(
+                    item.get('content', ''), metadata,
+                    KeyError('clause missing from batched response')
+                )
+        return results
+
+    async def achunk_multiple_texts(
+        self,
+        texts: List[Dict[str, Any]],
+        on_result: Optional[Callable[[str, List[SemanticChunk]], None]] = None
+    ) -> List[SemanticChunk]:
+        """
+        Chunk multiple texts concurrently
+
+        Short texts are wrapped directly; the rest are packed into
+        token-capped batches that fan out to the LLM in parallel under a
+        semaphore, so the workload pays neither one round-trip per clause
+        nor repeated instruction prompts.
+
+        Args:
+            texts: List of dicts with 'content' and 'metadata' keys
+            on_result: Optional callback invoked with (clause_id, chunks)
+                as each clause finishes, letting downstream stages
+                (embedding, graph insertion) start before the whole
+                collection is done
+
+        Returns:
+            List of all semantic chunks, in input order
+        """
+        def notify(index: int, chunks: List[SemanticChunk]):
+            if on_result is not None:
+                clause_id = texts[index].get('metadata', {}).get('clause_id', 'chunk')
+                on_result(clause_id, chunks)
+
+        encoder = _get_token_encoder()
+        results: List[Optional[List[SemanticChunk]]] = [None] * len(texts)
+        pending = []
+        token_counts: Dict[int, int] = {}
+        for i, item in enumerate(texts):
+            content = item.get('content', '')
+            n_tok = len(encoder.encode(content))
+            if n_tok < settings.semantic_min_tokens:
+                results[i] = self._short_text_chunk(content, item.get('metadata', {}))
+                notify(i, results[i])
+                continue
+            pre_classified = self._regex_chunk(content, item.get('metadata', {}))
+            if pre_classified is not None:
+                results[i] = pre_classified
+                notify(i, results[i])
+            else:
+                token_counts[i] = n_tok
+                pending.append(i)
+
+        # Policy corpora repeat boilerplate clauses; dispatch one LLM call
+        # per unique content and fan the result back to every duplicate
+        by_hash: Dict[bytes, List[int]] = defaultdict(list)
+        for i in pending:
+            digest = hashlib.blake2b(
+                texts[i].get('content', '').encode(), digest_size=16
+            ).digest()
+            by_hash[digest].append(i)
+        representatives = [indices[0] for indices in by_hash.values()]
+
+        # Pack clauses into batches capped by input tokens (and a sane
+        # clause count) so no single request grows unwieldy
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_tokens = 0
+        for i in representatives:
+            n_tok = token_counts[i]
+            if current and (current_tokens + n_tok > settings.semantic_batch_tokens
+                            or len(current) >= 10):
+                batches.append(current)
+                current = []
+                current_tokens = 0
+            current.append(i)
+            current_tokens += n_tok
+        if current:
+            batches.append(current)
+
+        sem = asyncio.Semaphore(settings.semantic_concurrency)
+
+        async def bound(batch: List[int]):
+            async with sem:
+                return batch, await self.achunk_batch([texts[i] for i in batch])
+
+        # Consume batches as they complete so callbacks fire while other
+        # requests are still in flight
+        for future in asyncio.as_completed([bound(batch) for batch in batches]):
+            batch, chunk_lists = await future
+            for i, chunks in zip(batch, chunk_lists):
+                results[i] = chunks
+                notify(i, chunks)
+
+        # Fan each unique result back out to its duplicate clauses
+        for indices in by_hash.values():
+            rep = indices[0]
+            for j in indices[1:]:
+                results[j] = self._clone_chunks(results[rep], texts[j].get('metadata', {}))
+                notify(j, results[j])
+
+        return [chunk for chunks in results for chunk in chunks]
+
     def chunk_multiple_texts(self, texts: List[Dict[str, Any]]) -> List[SemanticChunk]:
         """
         Chunk multiple texts in batch
-        
+
         Args:
             texts: List of dicts with 'content' and 'metadata' keys
-            
+
         Returns:
             List of all semantic chunks
         """
-        all_chunks = []
-        
-        for item in texts:
-            content = item.get('content', '')
-            metadata = item.get('metadata', {})
-            
-            chunks = self.chunk_text(content, metadata)
-                    all_chunks.extend(chunks)
-                    
+        all_chunks = asyncio.run(self.achunk_multiple_texts(texts))
+
         self.chunks = all_chunks
         logger.info(f"✅ Created {len(all_chunks)} semantic chunks from {len(texts)} texts")
-        
+
         return all_chunks
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -245,52 +710,56 @@ If the entire clause represents a single semantic type, return one chunk with al
         """
         if not self.chunks:
             return {'total_chunks': 0}
-        
-        stats = {
-            'total_chunks': len(self.chunks),
-            'chunks_by_type': {},
-            'avg_chunk_size': 0,
-            'max_chunk_size': 0,
-            'min_chunk_size': float('inf')
-        }
-        
-        chunk_sizes = []
-        
+
+        # Single streaming pass: type counts and size aggregates together,
+        # no intermediate size list
+        type_counts = Counter()
+        total_size = 0
+        max_size = 0
+        min_size = float('inf')
+
         for chunk in self.chunks:
-            # Count by type
-            if chunk.semantic_type not in stats['chunks_by_type']:
-                stats['chunks_by_type'][chunk.semantic_type] = 0
-            stats['chunks_by_type'][chunk.semantic_type] += 1
-            
-            # Size stats
+            type_counts[chunk.semantic_type] += 1
             size = len(chunk.content)
-            chunk_sizes.append(size)
-            stats['max_chunk_size'] = max(stats['max_chunk_size'], size)
-            stats['min_chunk_size'] = min(stats['min_chunk_size'], size)
-        
-        if chunk_sizes:
-            stats['avg_chunk_size'] = sum(chunk_sizes) / len(chunk_sizes)
-        
-        return stats
+            total_size += size
+            if size > max_size:
+                max_size = size
+            if size < min_size:
+                min_size = size
+
+        return {
+            'total_chunks': len(self.chunks),
+            'chunks_by_type': dict(type_counts),
+            'avg_chunk_size': total_size / len(self.chunks),
+            'max_chunk_size': max_size,
+            'min_chunk_size': min_size
+        }
     
-    def to_dict(self) -> List[Dict[str, Any]]:
+    def iter_dicts(self) -> Iterator[Dict[str, Any]]:
         """
-        Convert chunks to dictionary format
-        
-        Returns:
-            List of chunk dictionaries
+        Yield chunk dictionaries one at a time
+
+        Streaming consumers (JSON writers, Neo4j batchers) can iterate
+        without materializing a second full copy of the collection.
         """
-        return [
-            {
+        for c in self.chunks:
+            yield {
                 'chunk_id': c.chunk_id,
                 'content': c.content,
                 'semantic_type': c.semantic_type,
                 'metadata': c.metadata,
                 'parent_chunk_id': c.parent_chunk_id,
-                'char_count': len(c.content)
+                'char_count': c.char_count
             }
-            for c in self.chunks
-        ]
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """
+        Convert chunks to dictionary format
+
+        Returns:
+            List of chunk dictionaries
+        """
+        return list(self.iter_dicts())
 
 
 class HybridChunker:
@@ -310,27 +779,31 @@ class HybridChunker:
         self.semantic_chunker = semantic_chunker
         self.final_chunks = []
     
-    def chunk(self, clauses: List[Any], apply_semantic: bool = True) -> List[Any]:
+    async def achunk(self, clauses: List[Any], apply_semantic: bool = True,
+                     on_semantic_result: Optional[Callable[[str, List[SemanticChunk]], None]] = None) -> List[Any]:
         """
-        Apply hybrid chunking strategy
-        
+        Apply hybrid chunking with concurrent semantic refinement
+
         Args:
             clauses: List of Clause objects
             apply_semantic: Whether to apply semantic chunking to large chunks
-            
+            on_semantic_result: Optional callback invoked with
+                (clause_id, chunks) as each refined clause finishes, so
+                downstream stages can start while others are in flight
+
         Returns:
             List of final chunks
         """
         # First, apply rule-based chunking
         rule_chunks = self.rule_chunker.chunk_clauses(clauses)
         logger.info(f"Rule-based chunking: {len(rule_chunks)} chunks")
-        
+
         if not apply_semantic:
             return rule_chunks
-        
+
         # Then, apply semantic chunking to large chunks
         texts_to_refine = []
-        
+
         for chunk in rule_chunks:
             # Apply semantic chunking if chunk is large (> 1000 chars)
             if len(chunk.content) > 1000 and chunk.chunk_type == 'clause':
@@ -338,31 +811,47 @@ class HybridChunker:
                     'content': chunk.content,
                     'metadata': chunk.metadata
                 })
-        
+
         if texts_to_refine:
-            semantic_chunks = self.semantic_chunker.chunk_multiple_texts(texts_to_refine)
+            semantic_chunks = await self.semantic_chunker.achunk_multiple_texts(
+                texts_to_refine, on_result=on_semantic_result
+            )
+            self.semantic_chunker.chunks = semantic_chunks
             logger.info(f"Semantic refinement: {len(semantic_chunks)} chunks from {len(texts_to_refine)} large chunks")
             
+            # Index semantic chunks by parent once so the splice below is a
+            # dict lookup per rule chunk instead of a full scan
+            by_parent: Dict[str, List[SemanticChunk]] = defaultdict(list)
+            for sc in semantic_chunks:
+                by_parent[sc.parent_chunk_id].append(sc)
+
             # Combine: keep small rule chunks, replace large ones with semantic chunks
             self.final_chunks = []
-            
+
             for chunk in rule_chunks:
                 if len(chunk.content) > 1000 and chunk.chunk_type == 'clause':
-                    # Find corresponding semantic chunks
-                    clause_id = chunk.clause_id
-                    matching_semantic = [
-                        sc for sc in semantic_chunks 
-                        if sc.parent_chunk_id == clause_id
-                    ]
-                    self.final_chunks.extend(matching_semantic)
+                    self.final_chunks.extend(by_parent.get(chunk.clause_id, []))
                 else:
                     self.final_chunks.append(chunk)
         else:
             self.final_chunks = rule_chunks
-        
+
         logger.info(f"✅ Hybrid chunking complete: {len(self.final_chunks)} final chunks")
         return self.final_chunks
 
+    def chunk(self, clauses: List[Any], apply_semantic: bool = True) -> List[Any]:
+        """
+        Apply hybrid chunking strategy
+
+        Args:
+            clauses: List of Clause objects
+            apply_semantic: Whether to apply semantic chunking to large chunks
+
+        Returns:
+            List of final chunks
+        """
+        return asyncio.run(self.achunk(clauses, apply_semantic))
+
 
 if __name__ == "__main__":
     # Example usage
@@ -1,7 +1,8 @@
 """
 Configuration settings for PolicyGraph QA system
 """
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 import os
 
@@ -13,6 +14,9 @@ class Settings(BaseSettings):
     openai_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
     
+    # Redis (optional) — shared ingestion job state for multi-worker deploys
+    redis_url: Optional[str] = None
+
     # Neo4j Configuration
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_username: str = "neo4j"
@@ -23,6 +27,10 @@ class Settings(BaseSettings):
     llm_model: str = "gpt-4o-mini"
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    semantic_concurrency: int = 20  # Concurrent LLM calls during semantic chunking
+    semantic_batch_tokens: int = 6000  # Input-token cap per batched chunking request
+    semantic_min_tokens: int = 64  # Clauses below this skip the splitting LLM call
+    cache_dir: str = ".cache"  # On-disk cache for repeated LLM chunking calls
     
     # Vector Index Settings
     vector_dimensions: int = 1536
@@ -31,16 +39,17 @@ class Settings(BaseSettings):
     # API Settings
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    debug: bool = False
+    max_concurrency: int = 32  # In-flight requests per worker before shedding
+    max_upload_size_mb: int = 50  # Uploads beyond this are rejected with 413
     
     # RAG Settings
     retrieval_top_k: int = 10
     graph_depth: int = 2
     hybrid_alpha: float = 0.5  # Weight for semantic vs graph score
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-    
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
     def set_openai_api_key(self, key: str):
         """Set OpenAI API key at runtime"""
         self.openai_api_key = key
@@ -51,5 +60,11 @@ class Settings(BaseSettings):
         return bool(self.openai_api_key)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the Settings singleton; repeated calls skip .env parsing"""
+    return Settings()
+
+
+settings = get_settings()
 
@@ -2,12 +2,22 @@
 Policy Ingestion Pipeline
 Orchestrates the full pipeline from PDF to Neo4j graph
 """
-from typing import List, Dict, Any, Optional
+import asyncio
+import atexit
+import hashlib
+import os
+import random
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Protocol
 from pathlib import Path
+import httpx
 import numpy as np
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 from loguru import logger
-from openai import OpenAI
+from openai import OpenAI, RateLimitError
 
 from src.config.settings import settings
 from src.parsers.pdf_parser import PolicyPDFParser
@@ -15,6 +25,194 @@ from src.parsers.clause_extractor import ClauseExtractor, extract_clauses_from_t
 from src.chunking.rule_chunker import RuleBasedChunker
 from src.chunking.semantic_chunker import SemanticChunker
 
+# Rows per UNWIND transaction; large enough to amortize round-trips,
+# small enough to stay under the Neo4j heap
+BATCH_ROWS = 20_000
+
+# OpenAI embeddings endpoint limits: max items per request, per-item token
+# ceiling, and a conservative token budget per packed request.
+EMBED_MAX_ITEMS_PER_REQUEST = 2048
+EMBED_MAX_TOKENS_PER_ITEM = 8191
+EMBED_MAX_TOKENS_PER_REQUEST = 250_000
+
+# Chunks handed between the chunk/embed/write pipeline stages per slice
+PIPELINE_SLICE = 500
+
+# Row counts above this go through apoc.periodic.iterate so the server
+# commits in sub-batches instead of one heap-straining transaction
+APOC_ROWS_THRESHOLD = 50_000
+
+
+# Cypher statements as module constants: the server's query-plan cache is
+# keyed by query text, so every run of these literals hits a warm plan
+_CYPHER_PRODUCT_MERGE = """
+MERGE (prod:InsuranceProduct {code: $code})
+SET prod.name = $name,
+    prod.kind = 'property',
+    prod.lineOfBusiness = 'personal'
+"""
+
+_CYPHER_VERSION_MERGE = """
+MATCH (prod:InsuranceProduct {code: $product_code})
+MERGE (ver:PolicyVersion {versionId: $version_id})
+SET ver.documentUrl = $pdf_path,
+    ver.effectiveFrom = date()
+MERGE (prod)-[:HAS_POLICY_VERSION]->(ver)
+"""
+
+_CYPHER_CLAUSE_UNWIND = """
+MATCH (ver:PolicyVersion {versionId: $version_id})
+UNWIND $rows AS r
+MERGE (c:PolicyClause {clauseId: r.clause_id})
+SET c.title = r.title,
+    c.clauseType = r.clause_type,
+    c.text = r.text,
+    c.sectionPath = r.section_path,
+    c.articleNumber = r.article_number
+MERGE (ver)-[:HAS_CLAUSE]->(c)
+"""
+
+_CYPHER_SPECIAL_CLAUSE_UNWIND = """
+MATCH (ver:PolicyVersion {versionId: $version_id})
+UNWIND $specials AS s
+MERGE (sc:SpecialClause {name: s.name})
+MERGE (ver)-[:HAS_SPECIAL_CLAUSE]->(sc)
+WITH sc, s
+UNWIND s.clause_ids AS cid
+MATCH (c:PolicyClause {clauseId: cid})
+MERGE (sc)-[:HAS_CLAUSE]->(c)
+"""
+
+_CYPHER_CHUNK_UNWIND = """
+UNWIND $rows AS r
+MATCH (c:PolicyClause {clauseId: r.parent})
+CREATE (p:ParagraphChunk {
+    chunkId: r.chunk_id,
+    text: r.text,
+    semanticType: r.semantic_type
+})
+CREATE (c)-[:HAS_PARAGRAPH]->(p)
+WITH p, r
+CALL db.create.setNodeVectorProperty(p, 'embedding', r.embedding)
+FOREACH (_ IN CASE WHEN r.semantic_type = 'coverage' THEN [1] ELSE [] END |
+    CREATE (cov:Coverage {code: 'COV_' + r.chunk_id, name: r.snippet})
+    CREATE (p)-[:DEFINES_COVERAGE]->(cov)
+)
+FOREACH (_ IN CASE WHEN r.semantic_type = 'exclusion' THEN [1] ELSE [] END |
+    CREATE (exc:Exclusion {code: 'EXC_' + r.chunk_id, description: r.snippet})
+    CREATE (p)-[:HAS_EXCLUSION]->(exc)
+)
+"""
+
+
+# Server-side sub-batched variant of the chunk write: the outer query
+# streams the rows, the inner statement (the chunk UNWIND minus its own
+# UNWIND line) runs per row with APOC committing every 1000 rows
+_APOC_CHUNK_OUTER = "UNWIND $rows AS r RETURN r"
+_APOC_CHUNK_INNER = _CYPHER_CHUNK_UNWIND.replace("UNWIND $rows AS r\n", "", 1)
+_CYPHER_CHUNK_APOC = """
+CALL apoc.periodic.iterate($outer, $inner,
+    {batchSize: 1000, parallel: false, params: {rows: $rows}})
+"""
+
+
+class Chunkable(Protocol):
+    """What the embedding stage needs from a chunk (RuleChunk/SemanticChunk)"""
+    chunk_id: str
+    content: str
+
+
+@dataclass(slots=True)
+class EmbeddedChunk:
+    """One chunk normalized for the Neo4j write stage"""
+    chunk_id: str
+    text: str
+    parent_id: Optional[str]
+    semantic_type: str
+    embedding: np.ndarray
+
+# Content-addressed embedding cache: identical (model, text) pairs skip
+# the API call on re-ingestion; insurance boilerplate repeats verbatim
+# across products so hit rates are high
+_embed_cache_conn = None
+
+
+def _get_embed_cache() -> sqlite3.Connection:
+    global _embed_cache_conn
+    if _embed_cache_conn is None:
+        os.makedirs(settings.cache_dir, exist_ok=True)
+        _embed_cache_conn = sqlite3.connect(
+            os.path.join(settings.cache_dir, "embeddings.db"),
+            check_same_thread=False
+        )
+        _embed_cache_conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)"
+        )
+        _embed_cache_conn.commit()
+    return _embed_cache_conn
+
+
+def _embed_cache_key(text: str) -> str:
+    return hashlib.blake2b(
+        f"{settings.embedding_model}\0{text}".encode(), digest_size=16
+    ).hexdigest()
+
+
+_neo4j_driver = None
+
+
+def _close_driver():
+    global _neo4j_driver
+    if _neo4j_driver is not None:
+        try:
+            asyncio.run(_neo4j_driver.close())
+        except Exception:
+            pass
+        _neo4j_driver = None
+
+
+def get_driver(uri: str = None, username: str = None, password: str = None):
+    """
+    Process-wide async Neo4j driver.
+
+    Batch ingests build one pipeline per policy; sharing the driver lets
+    sessions reuse warm pooled bolt connections instead of re-dialling,
+    and the pool is closed once at interpreter exit.
+    """
+    global _neo4j_driver
+    if _neo4j_driver is None:
+        _neo4j_driver = AsyncGraphDatabase.driver(
+            uri or settings.neo4j_uri,
+            auth=(username or settings.neo4j_username,
+                  password or settings.neo4j_password),
+            max_connection_pool_size=50,
+            connection_acquisition_timeout=60,
+            keep_alive=True
+        )
+        atexit.register(_close_driver)
+    return _neo4j_driver
+
+
+_embed_encoder = None
+
+
+def _get_embed_encoder():
+    """tiktoken encoder for the embedding model, built once per process"""
+    global _embed_encoder
+    if _embed_encoder is None:
+        import tiktoken
+        try:
+            _embed_encoder = tiktoken.encoding_for_model(settings.embedding_model)
+        except KeyError:
+            _embed_encoder = tiktoken.get_encoding("cl100k_base")
+    return _embed_encoder
+
+
+def _batched(rows: List[Any], size: int = BATCH_ROWS):
+    """Yield successive row batches of at most `size` entries"""
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
 
 class PolicyIngestionPipeline:
     """
@@ -30,16 +228,31 @@ class PolicyIngestionPipeline:
         self.neo4j_username = neo4j_username or settings.neo4j_username
         self.neo4j_password = neo4j_password or settings.neo4j_password
         
-        self.driver = GraphDatabase.driver(
-            self.neo4j_uri,
-            auth=(self.neo4j_username, self.neo4j_password)
+        # Async driver: session.run awaits on the socket instead of
+        # blocking a thread, so multiple policies can ingest concurrently.
+        # Shared across pipelines so warm pooled connections are reused.
+        self.driver = get_driver(
+            self.neo4j_uri, self.neo4j_username, self.neo4j_password
         )
         
         self.clause_extractor = ClauseExtractor()
         self.rule_chunker = RuleBasedChunker(max_chunk_size=settings.chunk_size)
         self.semantic_chunker = SemanticChunker(model=settings.llm_model)
         
-        self.openai_client = OpenAI(api_key=settings.openai_api_key)
+        # Widened pool + HTTP/2 so the concurrent embedding batches
+        # multiplex on a few sockets instead of queueing behind httpx's
+        # conservative defaults
+        self.openai_client = OpenAI(
+            api_key=settings.openai_api_key,
+            http_client=httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0)
+            )
+        )
         
         logger.info("✅ PolicyIngestionPipeline initialized")
     
@@ -49,16 +262,31 @@ class PolicyIngestionPipeline:
                      product_name: str,
                      version_id: str,
                      use_semantic_chunking: bool = True) -> Dict[str, Any]:
+        """Synchronous wrapper around aingest_policy for scripts/CLI use"""
+        return asyncio.run(self.aingest_policy(
+            pdf_path=pdf_path,
+            product_code=product_code,
+            product_name=product_name,
+            version_id=version_id,
+            use_semantic_chunking=use_semantic_chunking
+        ))
+
+    async def aingest_policy(self,
+                            pdf_path: str,
+                            product_code: str,
+                            product_name: str,
+                            version_id: str,
+                            use_semantic_chunking: bool = True) -> Dict[str, Any]:
         """
         Complete ingestion pipeline
-        
+
         Args:
             pdf_path: Path to policy PDF
             product_code: Insurance product code
             product_name: Insurance product name
             version_id: Policy version ID
             use_semantic_chunking: Whether to use LLM-based semantic chunking
-            
+
         Returns:
             Dictionary with ingestion statistics
         """
@@ -76,303 +304,479 @@ class PolicyIngestionPipeline:
         }
         
         try:
-            # Step 1: Parse PDF
+            # Step 1: Parse PDF (CPU-bound; off the event loop)
             logger.info("📄 Step 1: Parsing PDF...")
-            with PolicyPDFParser(pdf_path) as parser:
-                text = parser.extract_full_text()
-                metadata = parser.get_metadata()
-                stats['pages'] = metadata['total_pages']
-            
+
+            def parse_pdf():
+                with PolicyPDFParser(pdf_path) as parser:
+                    return parser.extract_full_text(), parser.get_metadata()
+
+            text, metadata = await asyncio.to_thread(parse_pdf)
+            stats['pages'] = metadata['total_pages']
+
             # Step 2: Extract clauses
             logger.info("📋 Step 2: Extracting clauses...")
-            clauses = self.clause_extractor.extract_clauses(text)
-            # Extract items for each clause
-            for clause in clauses:
-                self.clause_extractor.extract_items_from_clause(clause)
+
+            def extract():
+                # Single pass: items are collected during the clause walk
+                return self.clause_extractor.extract_clauses(
+                    text, collect_items=True
+                )
+
+            clauses = await asyncio.to_thread(extract)
             stats['clauses'] = len(clauses)
-            
-            # Step 3: Create chunks
-            logger.info("✂️  Step 3: Creating chunks...")
-            rule_chunks = self.rule_chunker.chunk_clauses(clauses)
-            
-            if use_semantic_chunking:
-                # Apply semantic chunking to large chunks
-                chunks_to_refine = []
-                for chunk in rule_chunks:
-                    if len(chunk.content) > 800:
-                        chunks_to_refine.append({
-                            'content': chunk.content,
-                            'metadata': chunk.metadata
-                        })
-                
-                if chunks_to_refine:
-                    semantic_chunks = self.semantic_chunker.chunk_multiple_texts(chunks_to_refine)
-                    # Use semantic chunks
-                    chunks = semantic_chunks
+            # The raw document text is fully captured in the clauses now;
+            # don't hold a second copy through the long chunk/embed stages
+            del text
+
+            # Steps 3-5 run as a producer/consumer pipeline: chunking feeds
+            # an embed queue, embedding feeds a write queue, and the Neo4j
+            # writer starts on the clause nodes while chunks are still being
+            # produced. End-to-end time tracks the slowest stage instead of
+            # the sum of all stages. Counters in `stats` are only touched
+            # from these single-loop coroutines, so no locking is needed.
+            embed_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+            write_queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+            async def producer():
+                logger.info("✂️  Step 3: Creating chunks...")
+                rule_chunks = await asyncio.to_thread(
+                    self.rule_chunker.chunk_clauses, clauses
+                )
+
+                if use_semantic_chunking:
+                    # Only chunks over the size threshold need the LLM
+                    # pass; small rule chunks are kept as-is and merged
+                    # with the refined output rather than discarded
+                    small_chunks = []
+                    chunks_to_refine = []
+                    for chunk in rule_chunks:
+                        if len(chunk.content) > 800:
+                            chunks_to_refine.append({
+                                'content': chunk.content,
+                                'metadata': chunk.metadata
+                            })
+                        else:
+                            small_chunks.append(chunk)
+
+                    if chunks_to_refine:
+                        # The refine set carries the content/metadata refs;
+                        # drop the full chunk list before the long LLM pass
+                        del rule_chunks
+                        semantic_chunks = await self.semantic_chunker.achunk_multiple_texts(chunks_to_refine)
+                        chunks = small_chunks + semantic_chunks
+                    else:
+                        chunks = rule_chunks
                 else:
                     chunks = rule_chunks
-            else:
-                chunks = rule_chunks
-            
-            stats['chunks'] = len(chunks)
-            
-            # Step 4: Generate embeddings
-            logger.info("🔢 Step 4: Generating embeddings...")
-            chunks_with_embeddings = self._generate_embeddings(chunks)
-            stats['embeddings_created'] = len(chunks_with_embeddings)
-            
-            # Step 5: Create graph in Neo4j
-            logger.info("🔗 Step 5: Creating graph in Neo4j...")
-            graph_stats = self._create_graph(
-                product_code=product_code,
-                product_name=product_name,
-                version_id=version_id,
-                clauses=clauses,
-                chunks=chunks_with_embeddings,
-                pdf_path=pdf_path
-            )
+
+                stats['chunks'] = len(chunks)
+                for i in range(0, len(chunks), PIPELINE_SLICE):
+                    await embed_queue.put(chunks[i:i + PIPELINE_SLICE])
+                await embed_queue.put(None)
+
+            async def embedder():
+                logger.info("🔢 Step 4: Generating embeddings...")
+                while True:
+                    batch = await embed_queue.get()
+                    if batch is None:
+                        await write_queue.put(None)
+                        return
+                    # Thread-pooled internally; keep the loop free
+                    embedded = await asyncio.to_thread(
+                        self._generate_embeddings, batch
+                    )
+                    stats['embeddings_created'] += len(embedded)
+                    await write_queue.put(embedded)
+
+            async def writer():
+                logger.info("🔗 Step 5: Creating graph in Neo4j...")
+                async with self.driver.session() as session:
+                    counts = await self._create_policy_nodes(
+                        session=session,
+                        product_code=product_code,
+                        product_name=product_name,
+                        version_id=version_id,
+                        clauses=clauses,
+                        pdf_path=pdf_path
+                    )
+                    while True:
+                        embedded = await write_queue.get()
+                        if embedded is None:
+                            return counts
+                        chunk_counts = await self._write_chunks(session, embedded)
+                        counts['nodes_created'] += chunk_counts['nodes_created']
+                        counts['relationships_created'] += chunk_counts['relationships_created']
+
+            tasks = [
+                asyncio.create_task(producer()),
+                asyncio.create_task(embedder()),
+                asyncio.create_task(writer())
+            ]
+            try:
+                _, _, graph_stats = await asyncio.gather(*tasks)
+            except Exception:
+                # Don't leave sibling stages blocked on their queues
+                for task in tasks:
+                    task.cancel()
+                raise
             stats.update(graph_stats)
-            
+
             logger.info(f"✅ Ingestion complete! Stats: {stats}")
             return stats
-        
+
         except Exception as e:
             logger.error(f"❌ Ingestion failed: {e}")
             raise
     
-    def _generate_embeddings(self, chunks: List[Any]) -> List[Dict[str, Any]]:
+    def _generate_embeddings(self, chunks: List[Chunkable]) -> List[EmbeddedChunk]:
         """
         Generate embeddings for all chunks
-        
+
         Args:
             chunks: List of chunk objects (RuleChunk or SemanticChunk)
-            
+
         Returns:
-            List of chunk dictionaries with embeddings
+            List of EmbeddedChunk records normalized for the write stage
         """
         from tqdm import tqdm
-        
-        chunks_with_embeddings = []
-        
-        # Batch process embeddings
-        batch_size = 100
-        texts = [chunk.content if hasattr(chunk, 'content') else str(chunk) for chunk in chunks]
-        
-        logger.info(f"Generating embeddings for {len(texts)} chunks...")
-        
-        for i in tqdm(range(0, len(texts), batch_size), desc="Embedding batches"):
-            batch_texts = texts[i:i + batch_size]
-            
-            try:
-                # Call OpenAI embeddings API
-                response = self.openai_client.embeddings.create(
-                    model=settings.embedding_model,
-                    input=batch_texts
-                )
-                
-                # Extract embeddings
-                for j, embedding_obj in enumerate(response.data):
-                    chunk_idx = i + j
-                    chunk = chunks[chunk_idx]
-                    
-                    chunk_dict = {
-                        'chunk_id': chunk.chunk_id,
-                        'text': chunk.content if hasattr(chunk, 'content') else str(chunk),
-                        'embedding': embedding_obj.embedding,
-                        'metadata': {}
-                    }
-                    
-                    # Add metadata based on chunk type
-                    if hasattr(chunk, 'semantic_type'):
-                        # SemanticChunk
-                        chunk_dict['metadata'] = {
-                            'semantic_type': chunk.semantic_type,
-                            'parent_chunk_id': chunk.parent_chunk_id,
-                            **chunk.metadata
-                        }
-                    elif hasattr(chunk, 'chunk_type'):
-                        # RuleChunk
-                        chunk_dict['metadata'] = {
-                            'chunk_type': chunk.chunk_type,
-                            'clause_id': chunk.clause_id,
-                            **chunk.metadata
-                        }
-                    else:
-                        chunk_dict['metadata'] = {'type': 'unknown'}
-                    
-                    chunks_with_embeddings.append(chunk_dict)
-            
-            except Exception as e:
-                logger.error(f"Error generating embeddings for batch {i}: {e}")
+
+        # Batch process embeddings. Each API call is ~400ms of network
+        # latency, so batches run concurrently with results written into
+        # pre-allocated index slots to preserve input order.
+        # Same string objects flow from chunk.content through the embed
+        # input into EmbeddedChunk.text — no per-chunk copies, and no
+        # str(chunk) fallback minting new strings
+        texts = [chunk.content for chunk in chunks]
+        # Vectors stay float32 ndarrays end-to-end; conversion back to
+        # list[float] happens only at the final Cypher bind
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        # Serve repeat texts from the on-disk cache; only misses go to the
+        # API. Policies repeat boilerplate across clauses, so identical
+        # texts within one run also collapse onto a single owner index and
+        # fan the vector back out afterwards.
+        cache = _get_embed_cache()
+        keys = [_embed_cache_key(text) for text in texts]
+        miss_indices = []
+        key_owner: Dict[str, int] = {}
+        duplicates: Dict[int, List[int]] = {}
+        for idx, key in enumerate(keys):
+            owner = key_owner.get(key)
+            if owner is not None:
+                if embeddings[owner] is not None:
+                    embeddings[idx] = embeddings[owner]
+                else:
+                    duplicates.setdefault(owner, []).append(idx)
                 continue
-        
+            key_owner[key] = idx
+            row = cache.execute(
+                "SELECT vector FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                embeddings[idx] = np.frombuffer(row[0], dtype=np.float32)
+            else:
+                miss_indices.append(idx)
+
+        # Pack misses into token-budgeted batches instead of a fixed count:
+        # large requests amortize RPC overhead while staying under the
+        # endpoint's per-item and per-request limits.
+        encoder = _get_embed_encoder()
+        embed_texts: Dict[int, str] = {}
+        token_counts: Dict[int, int] = {}
+        for idx in miss_indices:
+            tokens = encoder.encode(texts[idx])
+            if len(tokens) > EMBED_MAX_TOKENS_PER_ITEM:
+                tokens = tokens[:EMBED_MAX_TOKENS_PER_ITEM]
+                embed_texts[idx] = encoder.decode(tokens)
+            else:
+                embed_texts[idx] = texts[idx]
+            token_counts[idx] = len(tokens)
+
+        miss_batches: List[List[int]] = []
+        batch: List[int] = []
+        batch_tokens = 0
+        for idx in miss_indices:
+            if batch and (batch_tokens + token_counts[idx] > EMBED_MAX_TOKENS_PER_REQUEST
+                          or len(batch) >= EMBED_MAX_ITEMS_PER_REQUEST):
+                miss_batches.append(batch)
+                batch, batch_tokens = [], 0
+            batch.append(idx)
+            batch_tokens += token_counts[idx]
+        if batch:
+            miss_batches.append(batch)
+
+        logger.info(
+            f"Generating embeddings for {len(miss_indices)} of {len(texts)} chunks "
+            f"({len(texts) - len(miss_indices)} cached or duplicate)..."
+        )
+
+        def embed_batch(batch_indices: List[int]):
+            batch_texts = [embed_texts[i] for i in batch_indices]
+            # Small jitter so concurrent batches don't hit the API in lockstep
+            time.sleep(random.uniform(0, 0.2))
+            delay = 1.0
+            for attempt in range(5):
+                try:
+                    response = self.openai_client.embeddings.create(
+                        model=settings.embedding_model,
+                        input=batch_texts
+                    )
+                    arr = np.asarray(
+                        [e.embedding for e in response.data], dtype=np.float32
+                    )
+                    return list(zip(batch_indices, arr))
+                except RateLimitError:
+                    if attempt == 4:
+                        raise
+                    time.sleep(delay + random.uniform(0, delay))
+                    delay *= 2
+                except Exception as e:
+                    if len(batch_indices) == 1:
+                        logger.error(f"Error generating embedding for chunk {batch_indices[0]}: {e}")
+                        return []
+                    # Bisect and retry each half so one bad row can't drop
+                    # the rest of the batch
+                    mid = len(batch_indices) // 2
+                    return embed_batch(batch_indices[:mid]) + embed_batch(batch_indices[mid:])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for batch_results in tqdm(
+                executor.map(embed_batch, miss_batches),
+                total=len(miss_batches), desc="Embedding batches"
+            ):
+                for idx, embedding in batch_results:
+                    embeddings[idx] = embedding
+                    cache.execute(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        (keys[idx], embedding.tobytes())
+                    )
+        cache.commit()
+
+        # Fan freshly embedded vectors out to in-run duplicate texts
+        for owner, dup_indices in duplicates.items():
+            if embeddings[owner] is None:
+                continue
+            for idx in dup_indices:
+                embeddings[idx] = embeddings[owner]
+
+        # Normalize each chunk to a slotted EmbeddedChunk once, resolving
+        # the type/parent dispatch here so the write stage never walks
+        # metadata dicts per row
+        chunks_with_embeddings: List[EmbeddedChunk] = []
+        for idx, chunk in enumerate(chunks):
+            if embeddings[idx] is None:
+                continue
+
+            meta = getattr(chunk, 'metadata', {}) or {}
+            if hasattr(chunk, 'semantic_type'):
+                # SemanticChunk
+                semantic_type = meta.get('semantic_type', chunk.semantic_type)
+                parent_id = meta.get('parent_chunk_id', chunk.parent_chunk_id) or \
+                            meta.get('clause_id') or \
+                            meta.get('parent_clause_id')
+            elif hasattr(chunk, 'chunk_type'):
+                # RuleChunk
+                semantic_type = meta.get('semantic_type',
+                                         meta.get('chunk_type', chunk.chunk_type))
+                parent_id = meta.get('parent_chunk_id') or \
+                            meta.get('clause_id', chunk.clause_id) or \
+                            meta.get('parent_clause_id')
+            else:
+                semantic_type = 'general'
+                parent_id = None
+
+            chunks_with_embeddings.append(EmbeddedChunk(
+                chunk_id=chunk.chunk_id,
+                text=texts[idx],
+                parent_id=parent_id,
+                semantic_type=semantic_type,
+                embedding=embeddings[idx]
+            ))
+
         logger.info(f"✅ Generated {len(chunks_with_embeddings)} embeddings")
         return chunks_with_embeddings
     
-    def _create_graph(self,
-                     product_code: str,
-                     product_name: str,
-                     version_id: str,
-                     clauses: List[Any],
-                     chunks: List[Dict[str, Any]],
-                     pdf_path: str) -> Dict[str, int]:
+    async def _create_policy_nodes(self,
+                                  session: Any,
+                                  product_code: str,
+                                  product_name: str,
+                                  version_id: str,
+                                  clauses: List[Any],
+                                  pdf_path: str) -> Dict[str, int]:
         """
-        Create the graph structure in Neo4j
-        
+        Create the product, version and clause structure in Neo4j
+
         Returns:
             Dictionary with node and relationship counts
         """
         nodes_created = 0
         relationships_created = 0
-        
-        with self.driver.session() as session:
-            # Create Product node
-            logger.info(f"Creating product node: {product_code}")
-            session.run("""
-                MERGE (prod:InsuranceProduct {code: $code})
-                SET prod.name = $name,
-                    prod.kind = 'property',
-                    prod.lineOfBusiness = 'personal'
-                """,
-                code=product_code,
-                name=product_name
-            )
-            nodes_created += 1
-            
-            # Create PolicyVersion node
-            logger.info(f"Creating policy version: {version_id}")
-            session.run("""
-                MATCH (prod:InsuranceProduct {code: $product_code})
-                MERGE (ver:PolicyVersion {versionId: $version_id})
-                SET ver.documentUrl = $pdf_path,
-                    ver.effectiveFrom = date()
-                MERGE (prod)-[:HAS_POLICY_VERSION]->(ver)
-                """,
-                product_code=product_code,
+
+        # Create Product node
+        logger.info(f"Creating product node: {product_code}")
+        await session.run(
+            _CYPHER_PRODUCT_MERGE,
+            code=product_code,
+            name=product_name
+        )
+        nodes_created += 1
+
+        # Create PolicyVersion node
+        logger.info(f"Creating policy version: {version_id}")
+        await session.run(
+            _CYPHER_VERSION_MERGE,
+            product_code=product_code,
+            version_id=version_id,
+            pdf_path=pdf_path
+        )
+        nodes_created += 1
+        relationships_created += 1
+
+        # Create PolicyClause nodes in UNWIND batches: one round-trip
+        # per batch instead of one per clause
+        logger.info(f"Creating {len(clauses)} clause nodes...")
+        clause_rows = [
+            {
+                'clause_id': clause.clause_id,
+                'title': clause.title,
+                'clause_type': clause.clause_type or 'General',
+                'text': clause.full_text,
+                'section_path': clause.section_path,
+                'article_number': clause.article_number
+            }
+            for clause in clauses
+        ]
+
+        # One explicit transaction per ≤20k-row batch: one plan lookup and
+        # one commit amortized over the whole batch
+        for batch in _batched(clause_rows):
+            async with await session.begin_transaction() as tx:
+                await tx.run(
+                    _CYPHER_CLAUSE_UNWIND,
+                    version_id=version_id,
+                    rows=batch
+                )
+                await tx.commit()
+            nodes_created += len(batch)
+            relationships_created += len(batch)
+
+        # Create SpecialClause nodes where applicable: group clauses by
+        # parent_section and attach each group in one round-trip instead
+        # of one statement per clause
+        by_section: Dict[str, List[str]] = {}
+        for clause in clauses:
+            if clause.parent_section:
+                by_section.setdefault(clause.parent_section, []).append(clause.clause_id)
+
+        if by_section:
+            specials = [
+                {'name': name, 'clause_ids': clause_ids}
+                for name, clause_ids in by_section.items()
+            ]
+            await session.run(
+                _CYPHER_SPECIAL_CLAUSE_UNWIND,
                 version_id=version_id,
-                pdf_path=pdf_path
+                specials=specials
             )
-            nodes_created += 1
-            relationships_created += 1
-            
-            # Create PolicyClause nodes
-            logger.info(f"Creating {len(clauses)} clause nodes...")
-            for clause in clauses:
-                session.run("""
-                    MATCH (ver:PolicyVersion {versionId: $version_id})
-                    MERGE (c:PolicyClause {clauseId: $clause_id})
-                    SET c.title = $title,
-                        c.clauseType = $clause_type,
-                        c.text = $text,
-                        c.sectionPath = $section_path,
-                        c.articleNumber = $article_number
-                    MERGE (ver)-[:HAS_CLAUSE]->(c)
-                    """,
-                    version_id=version_id,
-                    clause_id=clause.clause_id,
-                    title=clause.title,
-                    clause_type=clause.clause_type or 'General',
-                    text=clause.full_text,
-                    section_path=clause.section_path,
-                    article_number=clause.article_number
+            relationships_created += 2 * sum(len(v) for v in by_section.values())
+
+        return {
+            'nodes_created': nodes_created,
+            'relationships_created': relationships_created
+        }
+
+    async def _write_chunks(self,
+                           session: Any,
+                           chunks: List[EmbeddedChunk]) -> Dict[str, int]:
+        """
+        Write one batch of embedded chunks and their typed entities
+
+        Returns:
+            Dictionary with node and relationship counts
+        """
+        nodes_created = 0
+        relationships_created = 0
+
+        # One UNWIND per batch covers paragraph, coverage and exclusion
+        # writes: the FOREACH/CASE guards run the typed MERGEs only for
+        # matching rows, so no extra round-trips per entity type.
+        # Chunks arrive pre-normalized, so rows build by plain attribute
+        # access; parentless chunks can't be attached and are skipped.
+        logger.info(f"Creating {len(chunks)} chunk nodes with embeddings...")
+        chunk_rows = [
+            {
+                'chunk_id': chunk.chunk_id,
+                'parent': chunk.parent_id,
+                'text': chunk.text,
+                'semantic_type': chunk.semantic_type,
+                # Neo4j property binding needs list[float]; convert the
+                # float32 ndarray only here
+                'embedding': chunk.embedding.tolist(),
+                'snippet': chunk.text[:100]
+            }
+            for chunk in chunks if chunk.parent_id
+        ]
+
+        if len(chunk_rows) > APOC_ROWS_THRESHOLD:
+            # Very large row sets: hand the whole set to APOC, which
+            # commits server-side in 1000-row sub-batches and keeps the
+            # Neo4j heap bounded. Falls back to client-side batches if
+            # the APOC plugin is not installed.
+            try:
+                result = await session.run(
+                    _CYPHER_CHUNK_APOC,
+                    outer=_APOC_CHUNK_OUTER,
+                    inner=_APOC_CHUNK_INNER,
+                    rows=chunk_rows
                 )
-                nodes_created += 1
-                relationships_created += 1
-                
-                # Create SpecialClause if applicable
-                if clause.parent_section:
-                    session.run("""
-                        MATCH (ver:PolicyVersion {versionId: $version_id})
-                        MATCH (c:PolicyClause {clauseId: $clause_id})
-                        MERGE (sc:SpecialClause {name: $special_clause_name})
-                        MERGE (ver)-[:HAS_SPECIAL_CLAUSE]->(sc)
-                        MERGE (sc)-[:HAS_CLAUSE]->(c)
-                        """,
-                        version_id=version_id,
-                        clause_id=clause.clause_id,
-                        special_clause_name=clause.parent_section
-                    )
-                    relationships_created += 2
-            
-            # Create chunk nodes (ParagraphChunk/SemanticChunk)
-            logger.info(f"Creating {len(chunks)} chunk nodes with embeddings...")
-            for chunk in chunks:
-                parent_clause_id = chunk['metadata'].get('parent_chunk_id') or \
-                                  chunk['metadata'].get('clause_id') or \
-                                  chunk['metadata'].get('parent_clause_id')
-                
-                semantic_type = chunk['metadata'].get('semantic_type', 
-                                                     chunk['metadata'].get('chunk_type', 'general'))
-                
-                # Only create if we have a valid parent clause
-                if parent_clause_id:
-                    try:
-                session.run("""
-                    MATCH (c:PolicyClause {clauseId: $parent_clause_id})
-                    CREATE (p:ParagraphChunk {
-                        chunkId: $chunk_id,
-                        text: $text,
-                        semanticType: $semantic_type,
-                        embedding: $embedding
-                    })
-                    CREATE (c)-[:HAS_PARAGRAPH]->(p)
-                    """,
-                    parent_clause_id=parent_clause_id,
-                    chunk_id=chunk['chunk_id'],
-                    text=chunk['text'],
-                    semantic_type=semantic_type,
-                    embedding=chunk['embedding']
+                await result.consume()
+                typed = sum(
+                    1 for r in chunk_rows
+                    if r['semantic_type'] in ('coverage', 'exclusion')
                 )
-                nodes_created += 1
-                relationships_created += 1
-                    except Exception as e:
-                        logger.warning(f"Failed to create chunk {chunk['chunk_id']}: {e}")
-                        continue
-                
-                # Create Coverage/Exclusion nodes based on semantic type
-                if semantic_type == 'coverage':
-                    session.run("""
-                        MATCH (p:ParagraphChunk {chunkId: $chunk_id})
-                        MERGE (cov:Coverage {
-                            code: $code,
-                            name: $name
-                        })
-                        MERGE (p)-[:DEFINES_COVERAGE]->(cov)
-                        """,
-                        chunk_id=chunk['chunk_id'],
-                        code=f"COV_{chunk['chunk_id']}",
-                        name=chunk['text'][:100]
-                    )
-                    nodes_created += 1
-                    relationships_created += 1
-                
-                elif semantic_type == 'exclusion':
-                    session.run("""
-                        MATCH (p:ParagraphChunk {chunkId: $chunk_id})
-                        MERGE (exc:Exclusion {
-                            code: $code,
-                            description: $description
-                        })
-                        MERGE (p)-[:HAS_EXCLUSION]->(exc)
-                        """,
-                        chunk_id=chunk['chunk_id'],
-                        code=f"EXC_{chunk['chunk_id']}",
-                        description=chunk['text'][:100]
-                    )
-                    nodes_created += 1
-                    relationships_created += 1
-        
-        logger.info(f"✅ Created {nodes_created} nodes and {relationships_created} relationships")
-        
+                return {
+                    'nodes_created': len(chunk_rows) + typed,
+                    'relationships_created': len(chunk_rows) + typed
+                }
+            except Exception as e:
+                logger.warning(
+                    f"APOC batched write unavailable ({e}); "
+                    "falling back to client-side batches"
+                )
+
+        for batch in _batched(chunk_rows):
+            try:
+                async with await session.begin_transaction() as tx:
+                    await tx.run(_CYPHER_CHUNK_UNWIND, rows=batch)
+                    await tx.commit()
+                typed = sum(
+                    1 for r in batch
+                    if r['semantic_type'] in ('coverage', 'exclusion')
+                )
+                nodes_created += len(batch) + typed
+                relationships_created += len(batch) + typed
+            except Exception as e:
+                logger.warning(f"Failed to create chunk batch of {len(batch)}: {e}")
+                continue
+
         return {
             'nodes_created': nodes_created,
             'relationships_created': relationships_created
         }
     
+    async def aclose(self):
+        """
+        Release pipeline resources.
+
+        The Neo4j driver is a process-wide singleton closed once at
+        interpreter exit, so per-pipeline teardown is a no-op.
+        """
+        logger.info("Pipeline released (shared Neo4j driver stays open)")
+
     def close(self):
-        """Close connections"""
-        self.driver.close()
-        logger.info("Pipeline connections closed")
+        """Synchronous wrapper around aclose for scripts/CLI use"""
+        asyncio.run(self.aclose())
 
 
 if __name__ == "__main__":
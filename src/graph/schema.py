@@ -104,54 +104,39 @@ class PolicyGraphSchema:
         Initialize the complete graph schema with constraints, indexes, and vector indexes
         """
         logger.info("Initializing Neo4j schema...")
-        
+
+        vector_index_query = self.VECTOR_INDEX_TEMPLATE.format(
+            index_name="clause_embedding_index",
+            node_label="PolicyClause",
+            property_name="embedding",
+            dimensions=vector_dimensions,
+            similarity_function=similarity_function
+        )
+        paragraph_vector_index = self.VECTOR_INDEX_TEMPLATE.format(
+            index_name="paragraph_embedding_index",
+            node_label="ParagraphChunk",
+            property_name="embedding",
+            dimensions=vector_dimensions,
+            similarity_function=similarity_function
+        )
+
+        statements = (self.CONSTRAINTS + self.INDEXES
+                      + [vector_index_query, paragraph_vector_index])
+
+        # One session for all statements, but each auto-commits on its
+        # own: a version-sensitive failure (the vector-index DDL rejects
+        # on some server versions) must cost only a warning, not
+        # terminate a shared transaction and roll back the statements
+        # that already succeeded
         with self.driver.session() as session:
-            # Create constraints
-            for constraint in self.CONSTRAINTS:
-                try:
-                    session.run(constraint)
-                    logger.debug(f"Created constraint: {constraint[:50]}...")
-                except Exception as e:
-                    logger.warning(f"Constraint creation warning: {e}")
-            
-            # Create indexes
-            for index in self.INDEXES:
+            for statement in statements:
                 try:
-                    session.run(index)
-                    logger.debug(f"Created index: {index[:50]}...")
+                    session.run(statement).consume()
+                    logger.debug(f"Applied schema statement: {statement.strip()[:50]}...")
                 except Exception as e:
-                    logger.warning(f"Index creation warning: {e}")
-            
-            # Create vector index for PolicyClause embeddings
-            vector_index_query = self.VECTOR_INDEX_TEMPLATE.format(
-                index_name="clause_embedding_index",
-                node_label="PolicyClause",
-                property_name="embedding",
-                dimensions=vector_dimensions,
-                similarity_function=similarity_function
-            )
-            
-            try:
-                session.run(vector_index_query)
-                logger.info(f"Created vector index with {vector_dimensions} dimensions")
-            except Exception as e:
-                logger.warning(f"Vector index creation warning: {e}")
-            
-            # Create vector index for ParagraphChunk embeddings
-            paragraph_vector_index = self.VECTOR_INDEX_TEMPLATE.format(
-                index_name="paragraph_embedding_index",
-                node_label="ParagraphChunk",
-                property_name="embedding",
-                dimensions=vector_dimensions,
-                similarity_function=similarity_function
-            )
-            
-            try:
-                session.run(paragraph_vector_index)
-                logger.info("Created paragraph chunk vector index")
-            except Exception as e:
-                logger.warning(f"Paragraph vector index warning: {e}")
-        
+                    logger.warning(f"Schema statement warning: {e}")
+
+        logger.info(f"Created vector indexes with {vector_dimensions} dimensions")
         logger.info("✅ Schema initialization complete")
     
     def create_sample_data(self):
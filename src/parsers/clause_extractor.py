@@ -3,6 +3,7 @@ Clause Extractor for Insurance Policy Documents
 Extracts clauses based on Korean legal document structure (조/항/호)
 """
 import re
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
@@ -46,19 +47,98 @@ class Item:
     embedding: Optional[List[float]] = None
 
 
+# Patterns compiled once at import: bound Pattern methods skip the re-module
+# cache lookup that string-pattern calls pay on every line of the loops below
+_CLAUSE_RE = re.compile(r'제\s*(\d+)\s*조\s*[(（]([^)）]+)[)）]?')  # 제11조(보상하는 손해)
+_CLAUSE_NO_TITLE_RE = re.compile(r'제\s*(\d+)\s*조(?![가-힣])')  # 제11조
+_ARTICLE_RE = re.compile(r'[①-⑮]')  # Circled numbers (U+2460..U+246E)
+_ARTICLE_ALT_RE = re.compile(r'제?\s*(\d+)\s*항')  # 제1항 or 1항
+_ITEM_RE = re.compile(r'\s*(\d+)\s*\.')  # 1. 2. 3. ... (used with Pattern.match)
+_SPECIAL_RE = re.compile(r'【([^】]+특별약관)】|<([^>]+특별약관)>')  # Special clause markers
+
+# Fused per-line classifier for extract_clauses: one engine pass decides
+# whether a line opens a clause or a special section. Anchoring comes from
+# Pattern.match at the line's trimmed start offset (a literal '^' would not
+# match at pos > 0), so mid-line special markers need the separate search
+# fallback in _iter_tokens
+_LINE_CLASSIFIER = re.compile(
+    r'(?P<clause>제\s*(?P<cnum>\d+)\s*조\s*[(（](?P<ctitle>[^)）]+)[)）]?)'
+    r'|(?P<special>【(?P<sname1>[^】]+특별약관)】|<(?P<sname2>[^>]+특별약관)>)'
+)
+
+def _iter_tokens(text: str):
+    """
+    Walk the document once, yielding (kind, value, start, end) tokens.
+
+    start/end are whitespace-trimmed offsets into `text` — lines are
+    classified via Pattern.match/search with pos/endpos, so no per-line
+    substring is allocated; callers slice text[start:end] only when they
+    actually keep a line.
+
+    Kinds:
+        'special' — value is the special-section name
+        'clause'  — value is (article_number, title)
+        'item'    — enumerated item line (1. 2. 3. ...)
+        'text'    — any other line (value is None)
+    """
+    n = len(text)
+    pos = 0
+    while True:
+        newline = text.find('\n', pos)
+        line_end = n if newline < 0 else newline
+
+        # Trim by moving offsets instead of allocating line.strip()
+        start = pos
+        while start < line_end and text[start].isspace():
+            start += 1
+        end = line_end
+        while end > start and text[end - 1].isspace():
+            end -= 1
+
+        match = _LINE_CLASSIFIER.match(text, start, end)
+        if match is not None:
+            if match.group('special') is not None:
+                yield 'special', match.group('sname1') or match.group('sname2'), start, end
+            else:
+                yield ('clause',
+                       (int(match.group('cnum')), match.group('ctitle').strip()),
+                       start, end)
+        elif _ITEM_RE.match(text, start, end):
+            yield 'item', None, start, end
+        else:
+            special = _SPECIAL_RE.search(text, start, end)
+            if special:
+                yield 'special', special.group(1) or special.group(2), start, end
+            else:
+                yield 'text', None, start, end
+
+        if newline < 0:
+            break
+        pos = newline + 1
+
+
+# Fused cross-reference pattern for find_cross_references: one pass
+# captures 조/항/호 levels together, with the hangul lookahead guarding
+# only the bare-clause form (so 제1조의2 style compounds don't match)
+_XREF_FUSED_RE = re.compile(
+    r'제\s*(\d+)\s*조(?:\s*제\s*(\d+)\s*항(?:\s*제\s*(\d+)\s*호)?|(?![가-힣]))'
+)
+
+
 class ClauseExtractor:
     """
     Extract structured clauses from insurance policy documents
     Based on Korean legal document patterns (조/항/호)
     """
-    
-    # Regex patterns for Korean legal structures
-    CLAUSE_PATTERN = r'제\s*(\d+)\s*조\s*[(（]([^)）]+)[)）]?'  # 제11조(보상하는 손해)
-    CLAUSE_PATTERN_NO_TITLE = r'제\s*(\d+)\s*조(?![가-힣])'  # 제11조
-    ARTICLE_PATTERN = r'①|②|③|④|⑤|⑥|⑦|⑧|⑨|⑩|⑪|⑫|⑬|⑭|⑮'  # Circled numbers
-    ARTICLE_PATTERN_ALT = r'제?\s*(\d+)\s*항'  # 제1항 or 1항
-    ITEM_PATTERN = r'^\s*(\d+)\s*\.'  # 1. 2. 3. ...
-    SPECIAL_CLAUSE_PATTERN = r'【([^】]+특별약관)】|<([^>]+특별약관)>'  # Special clause markers
+
+    # Raw patterns kept for documentation/introspection; matching goes
+    # through the precompiled module-level Pattern objects
+    CLAUSE_PATTERN = _CLAUSE_RE.pattern
+    CLAUSE_PATTERN_NO_TITLE = _CLAUSE_NO_TITLE_RE.pattern
+    ARTICLE_PATTERN = _ARTICLE_RE.pattern
+    ARTICLE_PATTERN_ALT = _ARTICLE_ALT_RE.pattern
+    ITEM_PATTERN = _ITEM_RE.pattern
+    SPECIAL_CLAUSE_PATTERN = _SPECIAL_RE.pattern
     
     # Note: Clause type detection is handled by LLM during semantic chunking
     # These are just hints for initial categorization
@@ -67,53 +147,95 @@ class ClauseExtractor:
         """Initialize the clause extractor"""
         self.clauses: List[Clause] = []
         self.special_sections: List[str] = []
+        self._clause_index: Dict[str, Clause] = {}
+        self._by_type: Dict[str, List[Clause]] = defaultdict(list)
+        self._by_section: Dict[str, List[Clause]] = defaultdict(list)
+
+    def reset(self):
+        """
+        Clear extracted state so the instance can be reused across documents
+
+        All patterns are compiled once at module import, so reusing an
+        extractor (rather than constructing one per document) leaves only
+        this state to discard between runs.
+        """
+        self.clauses = []
+        self.special_sections = []
+        self._clause_index = {}
+        self._by_type.clear()
+        self._by_section.clear()
+
+    def _build_indexes(self):
+        """Rebuild the lookup indexes from self.clauses after extraction"""
+        self._clause_index = {c.clause_id: c for c in self.clauses}
+        self._by_type.clear()
+        self._by_section.clear()
+        for clause in self.clauses:
+            if clause.clause_type:
+                self._by_type[clause.clause_type].append(clause)
+            if clause.parent_section:
+                self._by_section[clause.parent_section].append(clause)
     
-    def extract_clauses(self, text: str) -> List[Clause]:
+    def extract_clauses(self, text: str, collect_items: bool = False) -> List[Clause]:
         """
-        Extract all clauses from document text
-        
+        Extract all clauses from document text in a single pass
+
         Args:
             text: Full document text
-            
+            collect_items: Also fill clause.items during the same walk,
+                avoiding the per-clause re-split extract_items_from_clause
+                would otherwise do
+
         Returns:
             List of extracted Clause objects
         """
         self.clauses = []
-        lines = text.split('\n')
-        
+
         current_clause = None
-        current_text = []
+        clause_start = 0  # slice bounds of the open clause's text
+        clause_end = 0
         current_special_section = None
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            
-            # Check for special clause markers (특별약관)
-            special_match = re.search(self.SPECIAL_CLAUSE_PATTERN, line)
-            if special_match:
-                current_special_section = special_match.group(1) or special_match.group(2)
+        current_items = []  # completed item texts for the open clause
+        current_item = []   # lines of the item being accumulated
+
+        def flush_item():
+            if current_item:
+                current_items.append(' '.join(current_item).strip())
+                current_item.clear()
+
+        def flush_clause():
+            nonlocal current_clause
+            if current_clause:
+                # One slice of the source text per clause instead of a
+                # per-line list plus join; interior lines keep their
+                # original indentation
+                current_clause.full_text = text[clause_start:clause_end].strip()
+                # Note: clause_type will be determined by LLM during semantic chunking
+                current_clause.clause_type = self._get_hint_from_title(current_clause.title)
+                if collect_items:
+                    flush_item()
+                    current_clause.items = list(current_items)
+                    current_items.clear()
+                self.clauses.append(current_clause)
+                current_clause = None
+
+        for kind, value, start, end in _iter_tokens(text):
+            if kind == 'special':
+                current_special_section = value
                 logger.debug(f"Found special section: {current_special_section}")
                 continue
-            
-            # Check for clause pattern
-            clause_match = re.match(self.CLAUSE_PATTERN, line)
-            if clause_match:
-                # Save previous clause
-                if current_clause:
-                    current_clause.full_text = '\n'.join(current_text).strip()
-                    # Note: clause_type will be determined by LLM during semantic chunking
-                    current_clause.clause_type = self._get_hint_from_title(current_clause.title)
-                    self.clauses.append(current_clause)
-                
+
+            if kind == 'clause':
+                flush_clause()
+
                 # Start new clause
-                article_num = int(clause_match.group(1))
-                title = clause_match.group(2).strip()
+                article_num, title = value
                 clause_id = f"제{article_num}조"
-                
+
                 section_path = clause_id
                 if current_special_section:
                     section_path = f"{current_special_section}>{clause_id}"
-                
+
                 current_clause = Clause(
                     clause_id=clause_id,
                     article_number=article_num,
@@ -123,20 +245,26 @@ class ClauseExtractor:
                     parent_section=current_special_section,
                     clause_type=None  # Will be determined by LLM during chunking
                 )
-                current_text = [line]
-                
+                clause_start, clause_end = start, end
+
                 logger.debug(f"Found clause: {clause_id} - {title}")
-            
-            elif current_clause:
-                current_text.append(line)
-        
+                continue
+
+            if current_clause:
+                clause_end = end
+                if collect_items:
+                    # Item lines are the only ones still materialized
+                    if kind == 'item':
+                        flush_item()
+                        current_item.append(text[start:end])
+                    elif current_item:
+                        current_item.append(text[start:end])
+
         # Save last clause
-        if current_clause:
-            current_clause.full_text = '\n'.join(current_text).strip()
-            # Note: clause_type will be determined by LLM during semantic chunking
-            current_clause.clause_type = self._get_hint_from_title(current_clause.title)
-            self.clauses.append(current_clause)
-        
+        flush_clause()
+
+        self._build_indexes()
+
         logger.info(f"✅ Extracted {len(self.clauses)} clauses")
         return self.clauses
     
@@ -186,7 +314,7 @@ class ClauseExtractor:
             line = line.strip()
             
             # Check for item pattern (1. 2. 3. ...)
-            item_match = re.match(self.ITEM_PATTERN, line)
+            item_match = _ITEM_RE.match(line)
             
             if item_match:
                 # Save previous item
@@ -219,18 +347,29 @@ class ClauseExtractor:
             List of special clause metadata
         """
         special_clauses = []
-        lines = text.split('\n')
-        
-        for i, line in enumerate(lines):
-            match = re.search(self.SPECIAL_CLAUSE_PATTERN, line)
+
+        # Scan line by line via offsets; only marker lines are materialized
+        n = len(text)
+        pos = 0
+        line_number = 0
+        while True:
+            newline = text.find('\n', pos)
+            end = n if newline < 0 else newline
+            line_number += 1
+
+            match = _SPECIAL_RE.search(text, pos, end)
             if match:
                 name = match.group(1) or match.group(2)
                 special_clauses.append({
                     'name': name,
-                    'line_number': i + 1,
-                    'marker': line.strip()
+                    'line_number': line_number,
+                    'marker': text[pos:end].strip()
                 })
                 logger.debug(f"Found special clause: {name}")
+
+            if newline < 0:
+                break
+            pos = newline + 1
         
         logger.info(f"Extracted {len(special_clauses)} special clauses")
         return special_clauses
@@ -245,10 +384,9 @@ class ClauseExtractor:
         Returns:
             Clause object or None
         """
-        for clause in self.clauses:
-            if clause.clause_id == clause_id:
-                return clause
-        return None
+        # O(1) via the index built after extraction; cross-reference
+        # resolution does this lookup once per reference
+        return self._clause_index.get(clause_id)
     
     def get_clauses_by_type(self, clause_type: str) -> List[Clause]:
         """
@@ -260,7 +398,7 @@ class ClauseExtractor:
         Returns:
             List of matching clauses
         """
-        return [c for c in self.clauses if c.clause_type == clause_type]
+        return list(self._by_type.get(clause_type, ()))
     
     def get_clauses_by_special_section(self, section_name: str) -> List[Clause]:
         """
@@ -272,7 +410,7 @@ class ClauseExtractor:
         Returns:
             List of clauses in that section
         """
-        return [c for c in self.clauses if c.parent_section == section_name]
+        return list(self._by_section.get(section_name, ()))
     
     def extract_paragraphs_and_items(self, clause: Clause) -> Tuple[List[Paragraph], List[Item]]:
         """
@@ -288,14 +426,7 @@ class ClauseExtractor:
         items = []
         
         lines = clause.full_text.split('\n')
-        
-        # Circled number mapping (①, ②, ③...)
-        circled_map = {
-            '①': 1, '②': 2, '③': 3, '④': 4, '⑤': 5,
-            '⑥': 6, '⑦': 7, '⑧': 8, '⑨': 9, '⑩': 10,
-            '⑪': 11, '⑫': 12, '⑬': 13, '⑭': 14, '⑮': 15
-        }
-        
+
         current_paragraph = None
         current_paragraph_text = []
         current_item = None
@@ -306,13 +437,11 @@ class ClauseExtractor:
             if not stripped:
                 continue
             
-            # Check for paragraph marker (①, ②, etc.)
-            circled_found = None
-            for symbol, num in circled_map.items():
-                if symbol in stripped:
-                    circled_found = (symbol, num)
-                    break
-            
+            # Check for paragraph marker (①, ②, etc.): the circled digits
+            # are contiguous codepoints, so one regex search finds the
+            # marker and its number falls out of codepoint arithmetic
+            circled_found = _ARTICLE_RE.search(stripped)
+
             if circled_found:
                 # Save previous item (if any) before starting new paragraph
                 if current_item:
@@ -325,8 +454,8 @@ class ClauseExtractor:
                     current_paragraph.text = '\n'.join(current_paragraph_text).strip()
                     paragraphs.append(current_paragraph)
                 
-                # Start new paragraph
-                para_num = circled_found[1]
+                # Start new paragraph (① is U+2460, so number = cp - 0x245F)
+                para_num = ord(circled_found.group()) - 0x245F
                 para_id = f"{clause.clause_id}제{para_num}항"
                 current_paragraph = Paragraph(
                     paragraph_id=para_id,
@@ -342,7 +471,7 @@ class ClauseExtractor:
                 continue
             
             # Check for item pattern (1. 2. 3. ...)
-            item_match = re.match(r'^\s*(\d+)\s*\.', stripped)
+            item_match = _ITEM_RE.match(stripped)
             if item_match and current_paragraph:
                 # Save previous item
                 if current_item:
@@ -406,41 +535,30 @@ class ClauseExtractor:
             List of reference dictionaries with 'from', 'to', 'type'
         """
         references = []
-        
-        # Pattern 1: 제X조
-        clause_refs = re.findall(r'제\s*(\d+)\s*조(?![가-힣])', text)
-        for ref in clause_refs:
-            references.append({
-                'to': f'제{ref}조',
-                'type': 'clause'
-            })
-        
-        # Pattern 2: 제X조 제Y항
-        para_refs = re.findall(r'제\s*(\d+)\s*조\s*제\s*(\d+)\s*항', text)
-        for clause_num, para_num in para_refs:
-            references.append({
-                'to': f'제{clause_num}조제{para_num}항',
-                'type': 'paragraph'
-            })
-        
-        # Pattern 3: 제X조제Y항제Z호
-        item_refs = re.findall(r'제\s*(\d+)\s*조제\s*(\d+)\s*항제\s*(\d+)\s*호', text)
-        for clause_num, para_num, item_num in item_refs:
-            references.append({
-                'to': f'제{clause_num}조제{para_num}항제{item_num}호',
-                'type': 'item'
-            })
-        
-        # Remove duplicates
         seen = set()
-        unique_refs = []
-        for ref in references:
-            key = (ref['to'], ref['type'])
+
+        # One pass over the text: each match carries its deepest level,
+        # so a 제X조제Y항제Z호 reference yields one item ref instead of
+        # re-matching the same span per pattern. Duplicates are filtered
+        # at emission, so repeated references never allocate a dict
+        for match in _XREF_FUSED_RE.finditer(text):
+            clause_num, para_num, item_num = match.groups()
+            if item_num:
+                target = f'제{clause_num}조제{para_num}항제{item_num}호'
+                ref_type = 'item'
+            elif para_num:
+                target = f'제{clause_num}조제{para_num}항'
+                ref_type = 'paragraph'
+            else:
+                target = f'제{clause_num}조'
+                ref_type = 'clause'
+
+            key = (target, ref_type)
             if key not in seen:
                 seen.add(key)
-                unique_refs.append(ref)
-        
-        return unique_refs
+                references.append({'to': target, 'type': ref_type})
+
+        return references
     
     def to_dict(self) -> List[Dict[str, Any]]:
         """
@@ -465,24 +583,26 @@ class ClauseExtractor:
         ]
 
 
+# Shared instance for the convenience function: construction is cheap, but
+# batch callers invoking extract_clauses_from_text per page/section still
+# save the per-call allocation. The returned list is rebound on every
+# extraction, so callers keep independent results.
+_shared_extractor = ClauseExtractor()
+
+
 def extract_clauses_from_text(text: str) -> List[Clause]:
     """
     Convenience function to extract clauses from text
-    
+
     Args:
         text: Document text
-        
+
     Returns:
         List of Clause objects
     """
-    extractor = ClauseExtractor()
-    clauses = extractor.extract_clauses(text)
-    
-    # Extract items for each clause
-    for clause in clauses:
-        extractor.extract_items_from_clause(clause)
-    
-    return clauses
+    _shared_extractor.reset()
+    # Items are collected during the same walk; no per-clause re-split
+    return _shared_extractor.extract_clauses(text, collect_items=True)
 
 
 if __name__ == "__main__":
@@ -31,21 +31,24 @@ class HierarchicalRetriever:
         self.driver = driver
         self.openai_client = OpenAI(api_key=settings.openai_api_key)
         
-    def retrieve(self, query: str, top_k: int = 10) -> Dict[str, Any]:
+    def retrieve(self, query: str, top_k: int = 10,
+                 query_embedding: List[float] = None) -> Dict[str, Any]:
         """
         Retrieve relevant context for query using hierarchical strategy
-        
+
         Args:
             query: User query
             top_k: Number of initial candidates to retrieve
-            
+            query_embedding: Precomputed query embedding (optional)
+
         Returns:
             Dictionary with selected article, context, and metadata
         """
         logger.info(f"🔍 Hierarchical retrieval for: {query}")
-        
+
         # Step 1: Vector search for top-k nodes
-        query_embedding = self._generate_embedding(query)
+        if query_embedding is None:
+            query_embedding = self._generate_embedding(query)
         candidate_nodes = self._vector_search(query_embedding, top_k)
         
         if not candidate_nodes:
@@ -89,7 +92,11 @@ class HierarchicalRetriever:
         
         # Step 4: Build context with REFERS_TO connections
         context_data = self._build_context_with_references(selected_article['articleId'])
-        
+
+        # Precompute the citation preview once so API handlers don't slice
+        # the full article text per response
+        selected_article['text_preview'] = (selected_article.get('text') or '')[:200]
+
         return {
             'selected_article': selected_article,
             'context': context_data['context'],
@@ -104,13 +111,34 @@ class HierarchicalRetriever:
             }
         }
     
+    def retrieve_batch(self, queries: List[str], top_k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Retrieve context for multiple queries, embedding them in one API call
+
+        Args:
+            queries: User queries
+            top_k: Number of initial candidates per query
+
+        Returns:
+            List of retrieval results, one per query in input order
+        """
+        embeddings = self._generate_embeddings(queries)
+        return [
+            self.retrieve(query, top_k=top_k, query_embedding=embedding)
+            for query, embedding in zip(queries, embeddings)
+        ]
+
     def _generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text"""
+        return self._generate_embeddings([text])[0]
+
+    def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for multiple texts in a single API call"""
         response = self.openai_client.embeddings.create(
             model=settings.embedding_model,
-            input=text
+            input=texts
         )
-        return response.data[0].embedding
+        return [item.embedding for item in response.data]
     
     def _vector_search(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
         """
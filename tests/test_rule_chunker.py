@@ -0,0 +1,61 @@
+"""
+Regression tests for RuleBasedChunker paragraph splitting
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.chunking.rule_chunker import RuleBasedChunker
+from src.parsers.clause_extractor import Clause
+
+
+def _make_large_clause(paragraph_size: int = 200, paragraph_count: int = 50) -> Clause:
+    """Build a synthetic ~10k-char clause with no items (paragraph path)"""
+    paragraphs = []
+    for i in range(1, paragraph_count + 1):
+        header = f"제{i}문단 "
+        paragraphs.append(header + "가" * (paragraph_size - len(header)))
+    full_text = "\n\n".join(paragraphs)
+    return Clause(
+        clause_id="제99조",
+        article_number=99,
+        title="문단 분할 테스트",
+        full_text=full_text,
+    )
+
+
+def test_paragraph_split_respects_max_chunk_size():
+    """Every paragraph chunk stays within max_chunk_size + one-paragraph slack
+
+    Guards the flush logic in _chunk_large_clause_by_paragraphs: a
+    paragraph that overflows the cap must start a fresh chunk, not land
+    in the chunk that was just flushed.
+    """
+    max_chunk_size = 500
+    clause = _make_large_clause()
+    assert len(clause.full_text) >= 10_000
+
+    chunker = RuleBasedChunker(max_chunk_size=max_chunk_size)
+    chunks = chunker.chunk_clauses([clause])
+
+    assert len(chunks) > 1
+    longest_paragraph = max(
+        len(p) for p in clause.full_text.split("\n\n")
+    )
+    for chunk in chunks:
+        assert chunk.chunk_type == "paragraph"
+        assert len(chunk.content) <= max_chunk_size + longest_paragraph, (
+            f"{chunk.chunk_id} is {len(chunk.content)} chars, "
+            f"cap is {max_chunk_size} + {longest_paragraph} slack"
+        )
+
+
+def test_paragraph_split_preserves_content():
+    """Rejoining the paragraph chunks loses no text"""
+    clause = _make_large_clause()
+    chunker = RuleBasedChunker(max_chunk_size=500)
+    chunks = chunker.chunk_clauses([clause])
+
+    rejoined = "\n\n".join(chunk.content for chunk in chunks)
+    assert rejoined == clause.full_text